@@ -13,6 +13,7 @@ Attributes:
 
 # pylint: disable=C0103,C0114,E0401,W0611,W0622
 
+import re
 import sys
 import os
 
@@ -30,18 +31,13 @@ metadata = {
     "__author__": "",
     "__copyright__": "",
 }
+META_RE = re.compile(
+    r"""^(__version__|__author__|__copyright__)\s*=\s*f?["']([^"']+)""",
+    re.MULTILINE,
+)
 with open(myinit, "r", encoding="utf-8") as file:
-    for line in file:
-        line = line.strip()
-        if not line.startswith("__") or line.startswith("__all__"):
-            continue
-        for key in metadata:
-            if line.startswith(key):
-                if '"' in line:
-                    metadata[key] = line.split('"')[1]
-                elif "'" in line:
-                    metadata[key] = line.split("'")[1]
-                break
+    for match in META_RE.finditer(file.read()):
+        metadata[match.group(1)] = match.group(2)
 
 author = metadata["__author__"]
 copyright = metadata["__copyright__"]
@@ -32,17 +32,25 @@ Examples:
     True
 """
 
-from datetime import datetime
-from .job import Job
-from .step import Step
-from .task import Task
+import time
+import typing as t
+from importlib import import_module
+
+if t.TYPE_CHECKING:
+    from .job import Job
+    from .step import Step
+    from .task import Task
+
+# Tracker classes are imported on first access to keep ``import es_checkpoint``
+# cheap for callers that only need package metadata.
+_LAZY_IMPORTS = {"Job": ".job", "Step": ".step", "Task": ".task"}
 
 FIRST_YEAR = 2025
-now = datetime.now()
-if now.year == FIRST_YEAR:
+_YEAR = time.gmtime().tm_year
+if _YEAR == FIRST_YEAR:
     COPYRIGHT_YEARS = "2025"
 else:
-    COPYRIGHT_YEARS = f"2025-{now.year}"
+    COPYRIGHT_YEARS = f"2025-{_YEAR}"
 
 __version__ = "0.0.10"
 __author__ = "Aaron Mildenstein"
@@ -96,3 +104,27 @@ __all__ = [
     "__keywords__",
     "__classifiers__",
 ]
+
+
+def __getattr__(name: str) -> t.Any:
+    """Imports Job, Step, and Task lazily on first attribute access.
+
+    Args:
+        name: Attribute name requested from the package.
+
+    Returns:
+        t.Any: The requested tracker class.
+
+    Raises:
+        AttributeError: If name is not a lazily imported attribute.
+
+    Examples:
+        >>> import es_checkpoint
+        >>> es_checkpoint.Task.__name__
+        'Task'
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -4,13 +4,13 @@ Provides Trackable and TaskOrStep base classes for Job, Task, and Step trackers.
 """
 
 # pylint: disable=C0115,R0902,W0107
-from abc import ABC, abstractmethod
 import logging
+from operator import attrgetter
 import typing as t
 from .debug import debug, begin_end
 from .exceptions import MissingDocument, FatalError
-from .storage import StorageBackend
-from .utils import now_iso8601, get_progress_doc
+from .storage import StorageBackend, new_doc_id
+from .utils import now_iso8601, progress_doc_id, progress_doc_req
 
 logger = logging.getLogger(__name__)
 
@@ -18,9 +18,82 @@ if t.TYPE_CHECKING:
     from .job import Job
 
 
-class Trackable(ABC):
-    # Common attributes for tracking documents
-    ATTRLIST = ["start_time", "completed", "end_time", "errors", "logs"]
+def _is_empty(value: t.Any) -> bool:
+    """Checks if a value is None, or an empty str, list, or dict.
+
+    False and 0 are not empty, as completed, errors, and dry_run are booleans.
+
+    Examples:
+        >>> [_is_empty(v) for v in (None, "", [], {}, False, 0, "x")]
+        [True, True, True, True, False, False, False]
+    """
+    if value is None:
+        return True
+    if isinstance(value, (str, list, dict)):
+        return not value
+    return False
+
+
+def _tracked(slot: str, doc: str, meta: bool = False) -> property:
+    """Returns a property for a tracked field stored in a slot.
+
+    Assigning the property marks the cached tracking document dirty. For fields
+    read into TrackerMeta (meta=True), it also drops the cached TrackerMeta.
+
+    Examples:
+        >>> from unittest.mock import Mock
+        >>> tracker = Trackable(Mock(), "es-checkpoint")
+        >>> tracker._doc_dirty = False
+        >>> tracker.completed = True
+        >>> tracker._doc_dirty
+        True
+    """
+
+    def fset(self: "Trackable", value: t.Any) -> None:
+        setattr(self, slot, value)
+        self._doc_dirty = True
+        if meta:
+            self._meta_cache = None
+
+    return property(attrgetter(slot), fset, doc=doc)
+
+
+class Trackable:
+    __slots__ = (
+        "_cached_doc",
+        "_doc_dirty",
+        "_last_saved",
+        "_log_entries",
+        "_meta_cache",
+        "_pending_saves",
+        "_logs",
+        "_start_time",
+        "_end_time",
+        "_completed",
+        "_errors",
+        "_dry_run",
+        "backend",
+        "tracking_index",
+        "doc_id",
+        "status",
+        "prev_dry_run",
+        "stub",
+        "save_buffer_size",
+    )
+    # Common attributes for tracking documents. Identifier-like string literals
+    # are interned by the compiler, so these keys and the literal keys used in
+    # extra_fields already hash and compare by identity in document dicts.
+    ATTRLIST = ("start_time", "completed", "end_time", "errors", "logs")
+    # Fetches all ATTRLIST values from an instance in one call
+    _ATTR_GET = attrgetter(*ATTRLIST)
+    # Whether build_doc may reuse its last result until a tracked field changes
+    CACHE_DOC = True
+
+    start_time = _tracked("_start_time", "str: Start time of tracking", meta=True)
+    end_time = _tracked("_end_time", "str: End time of tracking")
+    completed = _tracked("_completed", "bool: Completion status")
+    errors = _tracked("_errors", "bool: Error status")
+    dry_run = _tracked("_dry_run", "bool: Dry run flag", meta=True)
 
     def __init__(
         self,
@@ -44,6 +117,18 @@ class Trackable(ABC):
             >>> tracker.doc_id
             'doc1'
         """
+        #: Last tracking document built by build_doc
+        self._cached_doc: t.Optional[t.Dict] = None
+        #: Whether the cached tracking document must be rebuilt
+        self._doc_dirty: bool = True
+        #: Last tracking document passed to the backend by record
+        self._last_saved: t.Optional[t.Dict] = None
+        #: (timestamp, message) entries from add_log not yet formatted into logs
+        self._log_entries: t.List[t.Tuple[str, t.Any]] = []
+        #: TrackerMeta cached by exceptions.get_tracker_meta
+        self._meta_cache = None
+        #: Buffered (index, doc_id, doc) saves waiting for flush()
+        self._pending_saves: t.List[t.Tuple[str, str, t.Dict]] = []
         #: StorageBackend: Backend for document operations
         self.backend = backend
         #: Name of the tracking index
@@ -52,24 +137,39 @@ class Trackable(ABC):
         self.doc_id = doc_id
         #: Status from storage backend
         self.status: t.Dict = {}
-        #: List of log messages
-        self.logs: t.List = []
-        #: Start time of tracking
-        self.start_time: str = ""
-        #: End time of tracking
-        self.end_time: str = ""
-        #: Completion status
-        self.completed: bool = False
-        #: Error status
-        self.errors: bool = False
-        #: Dry run flag
-        self.dry_run: bool = False
+        # Tracked fields, set through their slots as the doc is already dirty
+        self._logs: t.List[str] = []
+        self._start_time = ""
+        self._end_time = ""
+        self._completed = False
+        self._errors = False
+        self._dry_run = False
         #: Previous run dry run flag
         self.prev_dry_run: bool = False
         #: Short description
         self.stub: str = "Trackable"
+        #: Number of buffered saves that triggers a flush (1 writes immediately)
+        self.save_buffer_size: int = 1
+
+    def __init_subclass__(cls, **kwargs):
+        """Requires subclasses to override get_history and extra_fields.
+
+        Raises:
+            TypeError: If a subclass does not override a required method.
+
+        Examples:
+            >>> try:
+            ...     class Incomplete(Trackable):
+            ...         def get_history(self): pass
+            ... except TypeError as e:
+            ...     print(str(e))
+            Incomplete must override extra_fields()
+        """
+        super().__init_subclass__(**kwargs)
+        for name in ("get_history", "extra_fields"):
+            if getattr(cls, name) is getattr(Trackable, name):
+                raise TypeError(f"{cls.__name__} must override {name}()")
 
-    @abstractmethod
     def get_history(self):
         """Retrieves tracking history."""
         pass
@@ -78,6 +178,12 @@ class Trackable(ABC):
     def build_doc(self) -> t.Dict:
         """Builds a tracking document for the tracker.
 
+        The document is cached until one of the tracked fields (logs,
+        start_time, end_time, completed, errors, dry_run) is assigned or a log
+        message is added. Subclasses whose extra fields change after
+        construction set _doc_dirty themselves. A shallow copy is returned so
+        callers may add keys.
+
         Returns:
             dict: Dictionary for the tracking index.
 
@@ -93,15 +199,31 @@ class Trackable(ABC):
             '2023-01-01T00:00:00Z'
             >>> doc["test"]
             'value'
+            >>> tracker.build_doc() == doc
+            True
         """
-        debug.lv3(f"Building tracking document for {self.stub}")
-        doc = {attr: getattr(self, attr) for attr in self.ATTRLIST}
+        if self.CACHE_DOC and not self._doc_dirty and self._cached_doc is not None:
+            if debug.level >= 5:
+                debug.lv5(f"Reusing cached tracking document for {self.stub}")
+            return dict(self._cached_doc)
+        if debug.level >= 3:
+            debug.lv3(f"Building tracking document for {self.stub}")
+        # Constant-key literal for the ATTRLIST fields; keep in sync with ATTRLIST
+        doc = {
+            "start_time": self.start_time,
+            "completed": self.completed,
+            "end_time": self.end_time,
+            "errors": self.errors,
+            "logs": self.log_lines(),
+        }
         doc.update(self.extra_fields())
         doc = self.prune_empty_keys(doc)
-        debug.lv5(f"Return value = {doc!r}")
-        return doc
+        self._cached_doc = doc
+        self._doc_dirty = False
+        if debug.level >= 5:
+            debug.lv5(f"Return value = {doc!r}")
+        return dict(doc)
 
-    @abstractmethod
     def extra_fields(self) -> t.Dict:
         """Provides additional fields for the tracking document.
 
@@ -117,9 +239,58 @@ class Trackable(ABC):
         return {}
 
     @begin_end()
-    def add_log(self, value):
-        """Adds a timestamped log message."""
-        self.logs.append(f"{now_iso8601()} {value}")
+    def add_log(self, value, timestamp: t.Optional[str] = None):
+        """Adds a timestamped log message.
+
+        The entry is queued as a (timestamp, message) tuple and only formatted
+        into logs when logs is next read, usually when the tracking document is
+        built. Callers that already hold the
+        current time can pass it as timestamp to avoid another clock read.
+        """
+        self._log_entries.append((timestamp or now_iso8601(), value))
+        self._doc_dirty = True
+
+    @property
+    def logs(self) -> t.List[str]:
+        """list[str]: Log lines, formatted as "<timestamp> <message>" strings.
+
+        Entries queued by add_log are formatted on first read. Assigning None
+        sets an empty list.
+
+        Examples:
+            >>> from unittest.mock import Mock
+            >>> tracker = Trackable(Mock(), "es-checkpoint")
+            >>> tracker.add_log("Started", timestamp="2023-01-01T00:00:00Z")
+            >>> tracker.logs
+            ['2023-01-01T00:00:00Z Started']
+        """
+        if self._log_entries:
+            self._logs.extend(f"{ts} {msg}" for ts, msg in self._log_entries)
+            self._log_entries.clear()
+        return self._logs
+
+    @logs.setter
+    def logs(self, value: t.Optional[t.List[str]]) -> None:
+        # null2attr and status2attr assign None; keep logs a list
+        self._logs = [] if value is None else value
+        self._log_entries.clear()
+        self._doc_dirty = True
+
+    def log_lines(self) -> t.List[str]:
+        """Returns a copy of the log lines, for use in the tracking document.
+
+        Returns:
+            list[str]: Formatted log lines.
+
+        Examples:
+            >>> from unittest.mock import Mock
+            >>> tracker = Trackable(Mock(), "es-checkpoint")
+            >>> tracker.logs = ["2023-01-01T00:00:00Z Old"]
+            >>> tracker.add_log("New", timestamp="2023-01-02T00:00:00Z")
+            >>> tracker.log_lines()
+            ['2023-01-01T00:00:00Z Old', '2023-01-02T00:00:00Z New']
+        """
+        return list(self.logs)
 
     @begin_end()
     def attr2status(self):
@@ -132,31 +303,32 @@ class Trackable(ABC):
             >>> tracker.status["start_time"]
             '2023-01-01T00:00:00Z'
         """
-        debug.lv3(f"Setting self.status from attributes {self.ATTRLIST}")
-        for key in self.ATTRLIST:
-            self.status[key] = getattr(self, key)
+        if debug.level >= 3:
+            debug.lv3(f"Setting self.status from attributes {self.ATTRLIST}")
+        self.status.update(zip(self.ATTRLIST, self._ATTR_GET(self)))
 
     @begin_end()
     def begin(self):
         """Starts tracking by setting start time and status.
 
         Examples:
-            >>> from unittest.mock import Mock
+            >>> from unittest.mock import Mock, patch
             >>> tracker = Trackable(Mock(), "es-checkpoint")
             >>> tracker.dry_run = True
-            >>> tracker.record = Mock()
-            >>> tracker.begin()
+            >>> with patch.object(Trackable, "record"):
+            ...     tracker.begin()
             >>> tracker.start_time != ""
             True
             >>> tracker.completed
             False
         """
         logger.info(f"Begin tracking: {self.stub}...")
+        now = now_iso8601()
         if self.dry_run:
             msg = "DRY-RUN: No changes will be made"
             logger.info(msg)
-            self.add_log(msg)
-        self.start_time = now_iso8601()
+            self.add_log(msg, timestamp=now)
+        self.start_time = now
         self.completed = False
         self.record()
 
@@ -175,21 +347,26 @@ class Trackable(ABC):
             logmsg: Optional log message (default: None).
 
         Examples:
+            >>> from unittest.mock import Mock, patch
             >>> tracker = Trackable(Mock(), "es-checkpoint")
-            >>> tracker.record = Mock()
-            >>> tracker.end(completed=True, logmsg="Done")
+            >>> with patch.object(Trackable, "record"):
+            ...     tracker.end(completed=True, logmsg="Done")
             >>> tracker.completed
             True
-            >>> tracker.logs
+            >>> tracker.log_lines()  # doctest: +ELLIPSIS
             ['... Done']
         """
         self.end_time = now_iso8601()
         self.completed = completed
         self.errors = errors
         if logmsg:
-            self.add_log(logmsg)
+            self.add_log(logmsg, timestamp=self.end_time)
         self.record()
-        debug.lv2(f"{self.stub} ended. Completed: {completed}")
+        buffer = self.save_buffer()
+        if completed or buffer is self:
+            buffer.flush()
+        if debug.level >= 2:
+            debug.lv2(f"{self.stub} ended. Completed: {completed}")
 
     @begin_end()
     def finished(self) -> bool:
@@ -222,17 +399,41 @@ class Trackable(ABC):
         debug.lv5("Return value = False")
         return False
 
+    @begin_end()
+    def flush(self) -> None:
+        """Writes all buffered saves to the storage backend in one batch.
+
+        Examples:
+            >>> from unittest.mock import Mock
+            >>> backend = Mock()
+            >>> tracker = Trackable(backend, "es-checkpoint")
+            >>> tracker.save_buffer_size = 10
+            >>> tracker.queue_save("es-checkpoint", "doc1", {"field": "value"})
+            >>> backend.bulk_save.called
+            False
+            >>> tracker.flush()
+            >>> backend.bulk_save.call_args[0][0]
+            [('es-checkpoint', 'doc1', {'field': 'value'})]
+        """
+        if not self._pending_saves:
+            return
+        pending = self._pending_saves
+        self._pending_saves = []
+        if debug.level >= 3:
+            debug.lv3(f"Flushing {len(pending)} buffered save(s) for {self.stub}")
+        self.backend.bulk_save(pending)
+
     def fn_result(
         self,
         func: t.Callable,
-        args: t.Optional[t.Tuple] = None,
+        args: t.Tuple = (),
         kwargs: t.Optional[t.Dict] = None,
     ) -> t.Any:
         """Calls a function and handles exceptions.
 
         Args:
             func: Function to call.
-            args: Positional arguments (default: None).
+            args: Positional arguments (default: ()).
             kwargs: Keyword arguments (default: None).
 
         Returns:
@@ -254,21 +455,22 @@ class Trackable(ABC):
             Caught
         """
         try:
-            if args is None:
-                args = ()
             if kwargs is None:
-                kwargs = {}
-            result = func(*args, **kwargs)
+                result = func(*args)
+            else:
+                result = func(*args, **kwargs)
         except MissingDocument:
             debug.lv5("No document found")
             result = {}
         except Exception as exc:
             debug.lv3("Exiting function, raising exception")
-            debug.lv5(f"Exception: {exc}")
+            if debug.level >= 5:
+                debug.lv5(f"Exception: {exc}")
             msg = "Error in storage operation"
             logger.error(f"{msg}: {exc}")
-            raise FatalError(msg, errors=exc) from exc
-        debug.lv5(f"Return value = {result}")
+            raise FatalError(msg) from exc
+        if debug.level >= 5:
+            debug.lv5(f"Return value = {result}")
         return result
 
     @begin_end()
@@ -280,8 +482,11 @@ class Trackable(ABC):
             >>> tracker.start_time = "2023-01-01T00:00:00Z"
             >>> tracker.null2attr()
             >>> tracker.start_time
+            >>> tracker.build_doc()
+            {}
         """
-        debug.lv3(f"Overriding attributes {self.ATTRLIST} with None")
+        if debug.level >= 3:
+            debug.lv3(f"Overriding attributes {self.ATTRLIST} with None")
         for key in self.ATTRLIST:
             setattr(self, key, None)
 
@@ -302,32 +507,81 @@ class Trackable(ABC):
             {'a': 1}
         """
         debug.lv3("Removing empty keys from doc")
-        empty: t.List = [None, "", [], {}]
-        doc = {key: value for key, value in doc.items() if value not in empty}
-        debug.lv5(f"Post cleanup: {doc}")
+        doc = {key: value for key, value in doc.items() if not _is_empty(value)}
+        if debug.level >= 5:
+            debug.lv5(f"Post cleanup: {doc}")
         return doc
 
     @begin_end()
-    def record(self):
-        """Saves the current status to the storage backend.
+    def queue_save(self, index: str, doc_id: str, doc: t.Dict) -> None:
+        """Buffers a document save, flushing when the buffer is full.
+
+        A buffered save for the same index and doc_id is merged with the new
+        doc, so only the latest state of a tracking document is written. The
+        backend writes are partial updates, so keys missing from the new doc,
+        like a status set by Step.update_status, keep their buffered values.
+
+        Args:
+            index: Tracking index name.
+            doc_id: Document ID.
+            doc: Document data.
 
         Examples:
             >>> from unittest.mock import Mock
             >>> backend = Mock()
-            >>> backend.save.return_value = "doc1"
             >>> tracker = Trackable(backend, "es-checkpoint")
-            >>> tracker.build_doc = Mock(return_value={"field": "value"})
+            >>> tracker.queue_save("es-checkpoint", "doc1", {"field": "value"})
+            >>> backend.bulk_save.called
+            True
+
+            A later record() of the same doc keeps a buffered status:
+
+            >>> tracker.save_buffer_size = 10
+            >>> tracker.doc_id = "doc2"
+            >>> tracker.queue_save("es-checkpoint", "doc2", {"status": "running"})
             >>> tracker.record()
-            >>> backend.save.called
+            >>> tracker.flush()
+            >>> backend.bulk_save.call_args[0][0][0][2]["status"]
+            'running'
+        """
+        for pos, (pending_index, pending_id, pending_doc) in enumerate(
+            self._pending_saves
+        ):
+            if pending_index == index and pending_id == doc_id:
+                # A new dict, as the queued doc may also be held as _last_saved
+                self._pending_saves[pos] = (index, doc_id, {**pending_doc, **doc})
+                return
+        self._pending_saves.append((index, doc_id, doc))
+        if len(self._pending_saves) >= self.save_buffer_size:
+            self.flush()
+
+    @begin_end()
+    def record(self):
+        """Saves the current status to the storage backend.
+
+        Saves go through the save buffer. A new document is given an ID from
+        new_doc_id first, so its first save is buffered as well. Nothing is
+        saved if the document is unchanged since the last call.
+
+        Examples:
+            >>> from unittest.mock import Mock, patch
+            >>> backend = Mock()
+            >>> tracker = Trackable(backend, "es-checkpoint")
+            >>> with patch.object(Trackable, "build_doc", return_value={"f": "v"}):
+            ...     tracker.record()
+            >>> backend.bulk_save.called
+            True
+            >>> tracker.doc_id == backend.bulk_save.call_args[0][0][0][1]
             True
-            >>> tracker.doc_id
-            'doc1'
         """
         doc = self.build_doc()
-        if self.doc_id:
-            self.backend.save(self.tracking_index, self.doc_id, doc)
-        else:
-            self.doc_id = self.backend.save(self.tracking_index, None, doc)
+        if doc == self._last_saved:
+            debug.lv5("Tracking document unchanged, skipping save")
+            return
+        if not self.doc_id:
+            self.doc_id = new_doc_id()
+        self.save_buffer().queue_save(self.tracking_index, self.doc_id, doc)
+        self._last_saved = doc
 
     @begin_end()
     def report_history(self) -> None:
@@ -355,7 +609,15 @@ class Trackable(ABC):
         if self.errors:
             logger.warning(f"{prefix} encountered errors.")
             if self.logs:
-                logger.warning(f"{prefix} had log(s): {self.logs}")
+                logger.warning(f"{prefix} had log(s): {self.log_lines()}")
+
+    def save_buffer(self) -> "Trackable":
+        """Returns the tracker whose buffer holds this tracker's saves.
+
+        Returns:
+            Trackable: This tracker.
+        """
+        return self
 
     @begin_end()
     def status2attr(self):
@@ -368,12 +630,15 @@ class Trackable(ABC):
             >>> tracker.start_time
             '2023-01-01T00:00:00Z'
         """
-        debug.lv3(f"Setting attributes {self.ATTRLIST} from self.status")
+        if debug.level >= 3:
+            debug.lv3(f"Setting attributes {self.ATTRLIST} from self.status")
         for key in self.ATTRLIST:
             setattr(self, key, self.status.get(key, None))
 
 
 class TaskOrStep(Trackable):
+    __slots__ = ("_extra_skeleton", "job", "index", "task_id", "stepname")
+
     def __init__(self, job: "Job", index: str) -> None:
         """Initializes a TaskOrStep object for tracking.
 
@@ -383,21 +648,23 @@ class TaskOrStep(Trackable):
 
         Examples:
             >>> from unittest.mock import Mock
-            >>> job = Mock(backend=Mock(), tracking_index="es-checkpoint", name="job1")
+            >>> job = Mock(backend=Mock(), tracking_index="es-checkpoint")
+            >>> job.name = "job1"
             >>> task = TaskOrStep(job, "test_idx")
             >>> task.index
             'test_idx'
             >>> task.job.name
             'job1'
         """
-        debug.lv2("Initializing Task object")
         super().__init__(job.backend, job.tracking_index)
         self.job = job
         self.index = index
+        #: Static part of extra_fields, copied on each call
+        self._extra_skeleton: t.Dict = {"job": job.name}
         self.stub = f"Job: {job.name}"
+        # Task and Step set these after calling this initializer
         self.task_id = ""
         self.stepname = ""
-        debug.lv3("Task object initialized")
 
     @begin_end()
     def extra_fields(self) -> t.Dict:
@@ -408,7 +675,8 @@ class TaskOrStep(Trackable):
 
         Examples:
             >>> from unittest.mock import Mock
-            >>> job = Mock(backend=Mock(), tracking_index="es-checkpoint", name="job1")
+            >>> job = Mock(backend=Mock(), tracking_index="es-checkpoint")
+            >>> job.name = "job1"
             >>> task = TaskOrStep(job, "test_idx")
             >>> task.task_id = "task1"
             >>> task.stepname = "step1"
@@ -420,10 +688,8 @@ class TaskOrStep(Trackable):
             >>> fields["step"]
             'step1'
         """
-        fields = {
-            "job": self.job.name,
-            "dry_run": self.dry_run,
-        }
+        fields = self._extra_skeleton.copy()
+        fields["dry_run"] = self.dry_run
         if self.index:
             fields["index"] = self.index
         if self.stepname:
@@ -432,31 +698,66 @@ class TaskOrStep(Trackable):
             fields["task"] = self.task_id
         return fields
 
+    def save_buffer(self) -> "Job":
+        """Returns the Job, which buffers saves for all of its tasks and steps.
+
+        Returns:
+            Job: The parent Job.
+        """
+        return self.job
+
     @begin_end()
     def get_history(self):
         """Retrieves the history of a task or step from the storage backend.
 
-        Uses job name and task ID to fetch previous run data, updating status.
+        Uses job name, task ID and step name to fetch previous run data, updating
+        status. Steps take their doc from :meth:`Job.step_history`, which loads
+        the docs of all steps of a task with one search, and tasks from
+        :meth:`Job.task_history`, which has the docs preloaded by
+        :meth:`Job.preload_task_history`. When the job returns None, the doc is
+        fetched by its :func:`~es_checkpoint.utils.progress_doc_id`, and only
+        searched for if it has no doc under that ID. The ID of the doc found,
+        or the derived ID when there is none, is kept as doc_id, so the tracker
+        saves to the same doc on every run. Docs saved under random IDs by
+        earlier versions keep their IDs.
 
         Examples:
             >>> from unittest.mock import Mock
             >>> backend = Mock()
-            >>> backend.search.return_value = [{"completed": True}]
-            >>> job = Mock(backend=backend, tracking_index="es-checkpoint", name="job1")
+            >>> backend.get.return_value = {"completed": True}
+            >>> job = Mock(backend=backend, tracking_index="es-checkpoint")
+            >>> job.name = "job1"
+            >>> job.task_history.return_value = None
             >>> task = TaskOrStep(job, "test_idx")
             >>> task.task_id = "task1"
             >>> task.get_history()
-            >>> task.status["completed"]
+            >>> task.doc_id == progress_doc_id("job1", "task1")
             True
+            >>> backend.search.called
+            False
         """
-        kwargs = {"job": self.job, "task_id": self.task_id}
         if not self.task_id:
-            debug.lv2("No task_id set, skipping get_progress_doc()")
+            debug.lv2("No task_id set, skipping progress_doc_req()")
             return
-        fn = get_progress_doc
-        debug.lv4("TRY: get_progress_doc()")
-        result = self.fn_result(fn, kwargs=kwargs)
-        debug.lv5(f"get_progress_doc() result = {result!r}")
-        self.doc_id = result.get("_id", None)
+        doc_id = progress_doc_id(self.job.name, self.task_id, self.stepname)
+        if self.stepname:
+            result = self.job.step_history(self.task_id, self.stepname)
+        else:
+            result = self.job.task_history(self.task_id)
+        if result is None:
+            # A buffered save of this doc must be visible to the search
+            self.save_buffer().flush()
+            args = (self.backend, self.tracking_index, self.job.name, self.task_id)
+            # Only the ATTRLIST fields of the doc are read back into the tracker
+            kwargs = {
+                "stepname": self.stepname,
+                "source_includes": self.ATTRLIST,
+                "doc_id": doc_id,
+            }
+            debug.lv4("TRY: progress_doc_req()")
+            result = self.fn_result(progress_doc_req, args=args, kwargs=kwargs)
+        if debug.level >= 5:
+            debug.lv5(f"progress_doc_req() result = {result!r}")
+        self.doc_id = result.get("_id") or doc_id
         self.status = result.get("_source", {})
         self.attr2status()
@@ -13,6 +13,9 @@ debug = TieredDebug()
 def begin_end(begin: t.Optional[int] = 2, end: t.Optional[int] = 3) -> t.Callable:
     """Logs function entry and exit at specified debug levels.
 
+    The level functions and messages are resolved once at decoration time, and
+    nothing is logged when the current debug level is lower.
+
     Args:
         begin: Debug level for entry logging (1-5, default: 2).
         end: Debug level for exit logging (1-5, default: 3).
@@ -28,27 +31,28 @@ def begin_end(begin: t.Optional[int] = 2, end: t.Optional[int] = 3) -> t.Callabl
         >>> @begin_end(begin=2, end=3)
         ... def test_func():
         ...     pass
-        >>> test_func()
+        >>> with debug.change_level(3):
+        ...     test_func()
         >>> debug.lv2.called
         True
         >>> debug.lv3.called
         True
     """
-    mmap = {
-        1: debug.lv1,
-        2: debug.lv2,
-        3: debug.lv3,
-        4: debug.lv4,
-        5: debug.lv5,
-    }
+    begin_fn = getattr(debug, f"lv{begin}")
+    end_fn = getattr(debug, f"lv{end}")
 
     def decorator(func: t.Callable) -> t.Callable:
+        common = f"CALL: {func.__name__}()"
+        begin_msg = "BEGIN " + common
+        end_msg = "END " + common
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            common = f"CALL: {func.__name__}()"
-            mmap[begin](f"BEGIN {common}", stklvl=debug.stacklevel + 1)
+            if begin <= debug.level:
+                begin_fn(begin_msg, stklvl=debug.stacklevel + 1)
             result = func(*args, **kwargs)
-            mmap[end](f"END {common}", stklvl=debug.stacklevel + 1)
+            if end <= debug.level:
+                end_fn(end_msg, stklvl=debug.stacklevel + 1)
             return result
 
         return wrapper
@@ -10,9 +10,49 @@ TRACKING_INDEX: str = "es-checkpoint"
 """Name of the index used for progress/status tracking."""
 
 
+INDEX_SETTINGS: t.Dict[str, t.Dict[str, str]] = {
+    "index": {
+        "number_of_shards": "1",
+        "auto_expand_replicas": "0-1",
+    }
+}
+"""Elasticsearch index settings for the tracking index. Shared; do not mutate."""
+
+STATUS_MAPPINGS: t.Dict[
+    str, t.Union[t.Dict[str, t.Any], t.List[t.Dict[str, t.Dict[str, t.Any]]]]
+] = {
+    "properties": {
+        "job": {"type": "keyword"},
+        "task": {"type": "keyword"},
+        "step": {"type": "keyword"},
+        "join_field": {"type": "join", "relations": {"job": "task"}},
+        "cleanup": {"type": "keyword"},
+        "completed": {"type": "boolean"},
+        "end_time": {"type": "date"},
+        "errors": {"type": "boolean"},
+        "dry_run": {"type": "boolean"},
+        "index": {"type": "keyword"},
+        "logs": {"type": "text"},
+        "start_time": {"type": "date"},
+        "data": {"type": "wildcard"},
+    },
+    "dynamic_templates": [
+        {
+            "configuration": {
+                "path_match": "config.*",
+                "mapping": {"type": "keyword", "index": False},
+            }
+        }
+    ],
+}
+"""Elasticsearch index mappings for the tracking index. Shared; do not mutate."""
+
+
 def index_settings() -> t.Dict[str, t.Dict[str, str]]:
     """Provides Elasticsearch index settings for the tracking index.
 
+    Returns the shared INDEX_SETTINGS object; copy it before mutating.
+
     Returns:
         dict: Dictionary of index settings.
 
@@ -22,13 +62,10 @@ def index_settings() -> t.Dict[str, t.Dict[str, str]]:
         '1'
         >>> settings["index"]["auto_expand_replicas"]
         '0-1'
+        >>> index_settings() is settings
+        True
     """
-    return {
-        "index": {
-            "number_of_shards": "1",
-            "auto_expand_replicas": "0-1",
-        }
-    }
+    return INDEX_SETTINGS
 
 
 def status_mappings() -> (
@@ -36,6 +73,8 @@ def status_mappings() -> (
 ):
     """Provides Elasticsearch index mappings for the tracking index.
 
+    Returns the shared STATUS_MAPPINGS object; copy it before mutating.
+
     Returns:
         dict: Dictionary of index mappings.
 
@@ -46,28 +85,4 @@ def status_mappings() -> (
         >>> mappings["dynamic_templates"][0]["configuration"]["mapping"]["type"]
         'keyword'
     """
-    return {
-        "properties": {
-            "job": {"type": "keyword"},
-            "task": {"type": "keyword"},
-            "step": {"type": "keyword"},
-            "join_field": {"type": "join", "relations": {"job": "task"}},
-            "cleanup": {"type": "keyword"},
-            "completed": {"type": "boolean"},
-            "end_time": {"type": "date"},
-            "errors": {"type": "boolean"},
-            "dry_run": {"type": "boolean"},
-            "index": {"type": "keyword"},
-            "logs": {"type": "text"},
-            "start_time": {"type": "date"},
-            "data": {"type": "wildcard"},
-        },
-        "dynamic_templates": [
-            {
-                "configuration": {
-                    "path_match": "config.*",
-                    "mapping": {"type": "keyword", "index": False},
-                }
-            }
-        ],
-    }
+    return STATUS_MAPPINGS
@@ -5,8 +5,9 @@ errors in Job, Task, and Step trackers, as well as Elasticsearch API responses.
 """
 
 # pylint: disable=R0913,R0917,W0718
+import sys
 import typing as t
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 
 if t.TYPE_CHECKING:
@@ -18,8 +19,11 @@ Exceptions = t.Union[Exception, t.Tuple[Exception, ...]]
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS: t.Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, repr=False, eq=False, **_SLOTS)
 class TrackerMeta:
     """Metadata extracted from a Tracker object.
 
@@ -42,11 +46,52 @@ class TrackerMeta:
     tracking_index: str
     doc_id: t.Optional[str] = None
     start_time: t.Optional[str] = None
+    _repr: t.Optional[str] = field(default=None, init=False)
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the metadata.
+
+        The string is built on first use and reused, as the metadata is frozen.
+
+        Returns:
+            str: String representation including all fields.
+
+        Examples:
+            >>> meta = TrackerMeta(dry_run=False, stub="job1", tracking_index="idx")
+            >>> repr(meta)  # doctest: +ELLIPSIS
+            "TrackerMeta(dry_run=False, stub='job1', ..., start_time=None)"
+            >>> repr(meta) is repr(meta)
+            True
+        """
+        text = self._repr
+        if text is None:
+            text = (
+                f"TrackerMeta(dry_run={self.dry_run!r}, stub={self.stub!r}, "
+                f"tracking_index={self.tracking_index!r}, doc_id={self.doc_id!r}, "
+                f"start_time={self.start_time!r})"
+            )
+            object.__setattr__(self, "_repr", text)
+        return text
+
+
+def _fmt_errors(errors: t.Tuple) -> str:
+    """Formats a tuple of upstream exceptions for an exception repr.
+
+    Examples:
+        >>> _fmt_errors((ValueError("a"), KeyError("b")))
+        "ValueError('a'), KeyError('b')"
+    """
+    return ", ".join([repr(err) for err in errors])
 
 
 def get_tracker_meta(tracker: t.Union['Job', 'Task', 'Step']) -> TrackerMeta:
     """Extracts metadata from a Tracker object.
 
+    The result is cached on the tracker as ``_meta_cache``. Trackers clear it
+    when dry_run or start_time is assigned, and it is rebuilt when doc_id has
+    changed since. stub and tracking_index are only set while a tracker is
+    constructed.
+
     Args:
         tracker: The Tracker object (Job, Task, or Step).
 
@@ -61,15 +106,22 @@ def get_tracker_meta(tracker: t.Union['Job', 'Task', 'Step']) -> TrackerMeta:
         >>> meta = get_tracker_meta(tracker)
         >>> meta.stub
         'test'
+        >>> get_tracker_meta(tracker) is meta
+        True
 
     """
-    return TrackerMeta(
+    meta = getattr(tracker, "_meta_cache", None)
+    if isinstance(meta, TrackerMeta) and meta.doc_id == tracker.doc_id:
+        return meta
+    meta = TrackerMeta(
         dry_run=tracker.dry_run,
         stub=tracker.stub,
         tracking_index=tracker.tracking_index,
         doc_id=tracker.doc_id,
         start_time=tracker.start_time,
     )
+    tracker._meta_cache = meta  # pylint: disable=W0212
+    return meta
 
 
 class CheckpointError(Exception):
@@ -83,6 +135,8 @@ class CheckpointError(Exception):
         Base error
     """
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         """Returns a string representation of the exception.
 
@@ -105,19 +159,11 @@ class FatalError(CheckpointError):
         ... except FatalError as e:
         ...     print(str(e))
         Critical failure
+        >>> repr(FatalError("Critical failure"))
+        "FatalError('Critical failure')"
     """
 
-    def __repr__(self) -> str:
-        """Returns a string representation of the exception.
-
-        Returns:
-            str: String representation of the exception.
-
-        Examples:
-            >>> repr(FatalError("Critical failure"))
-            "FatalError('Critical failure')"
-        """
-        return f"{self.__class__.__name__}({self.args[0]!r})"
+    __slots__ = ()
 
 
 class NonFatalError(CheckpointError):
@@ -129,19 +175,11 @@ class NonFatalError(CheckpointError):
         ... except NonFatalError as e:
         ...     print(str(e))
         Minor issue
+        >>> repr(NonFatalError("Minor issue"))
+        "NonFatalError('Minor issue')"
     """
 
-    def __repr__(self) -> str:
-        """Returns a string representation of the exception.
-
-        Returns:
-            str: String representation of the exception.
-
-        Examples:
-            >>> repr(NonFatalError("Minor issue"))
-            "NonFatalError('Minor issue')"
-        """
-        return f"{self.__class__.__name__}({self.args[0]!r})"
+    __slots__ = ()
 
 
 class TrackerError(CheckpointError):
@@ -170,6 +208,8 @@ class TrackerError(CheckpointError):
         Task failed (TrackerMeta(...))
     """
 
+    __slots__ = ("message", "meta", "tracker_type")
+
     def __init__(
         self,
         message: str,
@@ -238,6 +278,11 @@ class EsResponse(Exception):
         API error
     """
 
+    __slots__ = ("message", "errors")
+
+    #: Optional attributes that subclasses include in __repr__ when they are set
+    _REPR_FIELDS: t.Tuple[str, ...] = ()
+
     def __init__(self, message: str, errors: Exceptions = ()):
         super().__init__(message)
         self.message = message
@@ -246,8 +291,12 @@ class EsResponse(Exception):
     def __repr__(self) -> str:
         """Returns a string representation of the exception.
 
+        Subclasses list their extra attributes in ``_REPR_FIELDS``; those that are
+        set appear between the message and the errors.
+
         Returns:
-            str: String representation including message and errors.
+            str: String representation including message, set extra attributes,
+            and errors.
 
         Examples:
             >>> err = EsResponse("API error", (ValueError("Invalid"),))
@@ -255,8 +304,13 @@ class EsResponse(Exception):
             "EsResponse('API error', errors=ValueError('Invalid'))"
         """
         parts = [repr(self.message)]
-        if self.errors:
-            parts.append(f"errors={', '.join(map(repr, list(self.errors)))}")
+        for name in self._REPR_FIELDS:
+            value = getattr(self, name)
+            if value:
+                parts.append(f"{name}={value!r}")
+        errors = self.errors
+        if errors:
+            parts.append(f"errors={_fmt_errors(errors)}")
         return f"{self.__class__.__name__}({', '.join(parts)})"
 
     def __str__(self) -> str:
@@ -286,23 +340,11 @@ class MissingError(EsResponse):
         ... except MissingError as e:
         ...     print(str(e))
         Not found
+        >>> repr(MissingError("Not found"))
+        "MissingError('Not found')"
     """
 
-    def __repr__(self) -> str:
-        """Returns a string representation of the exception.
-
-        Returns:
-            str: String representation including message and errors.
-
-        Examples:
-            >>> err = MissingError("Not found")
-            >>> repr(err)
-            "MissingError('Not found')"
-        """
-        parts = [repr(self.message)]
-        if self.errors:
-            parts.append(f"errors={', '.join(map(repr, list(self.errors)))}")
-        return f"{self.__class__.__name__}({', '.join(parts)})"
+    __slots__ = ()
 
 
 class MissingIndex(MissingError):
@@ -322,8 +364,13 @@ class MissingIndex(MissingError):
         ... except MissingIndex as e:
         ...     print(e.index)
         my_index
+        >>> repr(MissingIndex("Index missing", index="my_index"))
+        "MissingIndex('Index missing', index='my_index')"
     """
 
+    __slots__ = ("index",)
+    _REPR_FIELDS = ("index",)
+
     def __init__(
         self,
         message: str,
@@ -332,26 +379,6 @@ class MissingIndex(MissingError):
     ):
         super().__init__(message, errors)
         self.index = index
-        self.message = message
-        self.errors = errors if isinstance(errors, tuple) else (errors,)
-
-    def __repr__(self) -> str:
-        """Returns a string representation of the exception.
-
-        Returns:
-            str: String representation including message, index, and errors.
-
-        Examples:
-            >>> err = MissingIndex("Index missing", index="my_index")
-            >>> repr(err)
-            "MissingIndex('Index missing', index='my_index')"
-        """
-        parts = [repr(self.message)]
-        if self.index:
-            parts.append(f"index={repr(self.index)}")
-        if self.errors:
-            parts.append(f"errors={', '.join(map(repr, list(self.errors)))}")
-        return f"{self.__class__.__name__}({', '.join(parts)})"
 
 
 class MissingDocument(MissingError):
@@ -373,8 +400,13 @@ class MissingDocument(MissingError):
         ... except MissingDocument as e:
         ...     print(e.doc_id)
         123
+        >>> repr(MissingDocument("Doc missing", index="idx", doc_id="123"))
+        "MissingDocument('Doc missing', index='idx', doc_id='123')"
     """
 
+    __slots__ = ("index", "doc_id")
+    _REPR_FIELDS = ("index", "doc_id")
+
     def __init__(
         self,
         message: str,
@@ -385,28 +417,6 @@ class MissingDocument(MissingError):
         super().__init__(message, errors)
         self.index = index
         self.doc_id = doc_id
-        self.message = message
-        self.errors = errors if isinstance(errors, tuple) else (errors,)
-
-    def __repr__(self) -> str:
-        """Returns a string representation of the exception.
-
-        Returns:
-            str: String representation including message, index, doc_id, and errors.
-
-        Examples:
-            >>> err = MissingDocument("Doc missing", index="idx", doc_id="123")
-            >>> repr(err)
-            "MissingDocument('Doc missing', index='idx', doc_id='123')"
-        """
-        parts = [repr(self.message)]
-        if self.index:
-            parts.append(f"index={repr(self.index)}")
-        if self.doc_id:
-            parts.append(f"doc_id={repr(self.doc_id)}")
-        if self.errors:
-            parts.append(f"errors={', '.join(map(repr, list(self.errors)))}")
-        return f"{self.__class__.__name__}({', '.join(parts)})"
 
 
 class ClientError(EsResponse):
@@ -422,25 +432,8 @@ class ClientError(EsResponse):
         ... except ClientError as e:
         ...     print(str(e))
         Client error
+        >>> repr(ClientError("Client error"))
+        "ClientError('Client error')"
     """
 
-    def __init__(self, message: str, errors: Exceptions = ()):
-        super().__init__(message, errors)
-        self.message = message
-        self.errors = errors if isinstance(errors, tuple) else (errors,)
-
-    def __repr__(self) -> str:
-        """Returns a string representation of the exception.
-
-        Returns:
-            str: String representation including message and errors.
-
-        Examples:
-            >>> err = ClientError("Client error")
-            >>> repr(err)
-            "ClientError('Client error')"
-        """
-        parts = [repr(self.message)]
-        if self.errors:
-            parts.append(f"errors={', '.join(map(repr, list(self.errors)))}")
-        return f"{self.__class__.__name__}({', '.join(parts)})"
+    __slots__ = ()
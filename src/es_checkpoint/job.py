@@ -8,19 +8,48 @@ and manage configuration.
 import logging
 import typing as t
 from ._parent import Trackable
-from .tools.decorators import try_except
+from .tools.decorators import RetryPolicy, try_except
+from .tools.handlers import is_transient
 from .debug import debug, begin_end
 from .defaults import index_settings, status_mappings
 from .exceptions import ClientError, FatalError
-from .utils import create_index, get_tracking_doc, parse_job_config
+from .utils import (
+    create_index,
+    get_tracking_doc,
+    parse_job_config,
+    progress_docs_bulk,
+    step_docs_req,
+)
 
 if t.TYPE_CHECKING:
     from .storage import StorageBackend
 
 logger = logging.getLogger(__name__)
 
+#: Backoff for storage calls that fail because the cluster is busy or unreachable
+STORAGE_RETRY = RetryPolicy(retry_if=is_transient)
+
+_get_tracking_doc = try_except(
+    exceptions=ClientError, re_raise=True, retry=STORAGE_RETRY
+)(get_tracking_doc)
+
 
 class Job(Trackable):
+    __slots__ = (
+        "_config",
+        "_config_doc",
+        "_history_cache",
+        "_history_seen",
+        "_preloaded_tasks",
+        "cleanup",
+        "file_config",
+        "index_counts",
+        "indices",
+        "name",
+        "results",
+        "total",
+    )
+
     def __init__(
         self,
         backend: "StorageBackend",
@@ -28,6 +57,7 @@ class Job(Trackable):
         name: str,
         config: t.Dict,
         dry_run: bool = False,
+        save_buffer_size: int = 1,
     ):
         """Initializes a Job for tracking operations.
 
@@ -37,6 +67,9 @@ class Job(Trackable):
             name: Unique name for the job.
             config: Configuration dictionary for the job.
             dry_run: If True, simulates operations without changes (default: False).
+            save_buffer_size: Number of buffered tracking document saves, from this
+                job and its tasks and steps, that triggers a bulk write
+                (default: 1, which writes every save immediately).
 
         Examples:
             >>> from unittest.mock import Mock
@@ -53,17 +86,26 @@ class Job(Trackable):
         self.stub = name
         #: str: Name of the job
         self.name = name
-        debug.lv5(f"Job name: {name}")
         #: dict: Configuration from file
         self.file_config = config
-        debug.lv5(f"File config: {config}")
-        #: dict: Parsed job configuration
-        self.config: t.Dict = {}
+        #: dict: Serialized copy of config, built on first use by extra_fields
+        self._config_doc: t.Optional[t.Dict] = None
+        self.config = {}
         #: bool: Indicates if this is a dry run
         self.dry_run = dry_run
-        debug.lv5(f"Job dry_run: {dry_run}")
+        if debug.level >= 5:
+            debug.lv5(f"Job name: {name}, dry_run: {dry_run}, file config: {config}")
         #: bool: Indicates if previous run was a dry run
         self.prev_dry_run = False
+        #: int: Buffered saves that trigger a bulk write
+        self.save_buffer_size = save_buffer_size
+        #: t.Dict: Preloaded tracking docs, keyed by (task_id, stepname). Task docs
+        #: use an empty stepname
+        self._history_cache: t.Dict[t.Tuple[str, str], t.Dict] = {}
+        #: t.Set: Task IDs whose step docs have been preloaded
+        self._preloaded_tasks: t.Set[str] = set()
+        #: t.Set: (task_id, stepname) keys already handed out by step_history
+        self._history_seen: t.Set[t.Tuple[str, str]] = set()
         self.chk_idx()
         self.get_history()
         #: t.List: Results from job tasks
@@ -97,18 +139,63 @@ class Job(Trackable):
         debug.lv3("Building Job extra fields for tracking document")
         fields = {
             "job": self.name,
-            "config": parse_job_config(self.config, "write"),
+            "config": self.config_doc(),
             "join_field": "job",
             "dry_run": self.dry_run,
         }
         return fields
 
+    @property
+    def config(self) -> t.Dict:
+        """dict: Parsed job configuration.
+
+        Assigning a new configuration discards the serialized copy returned by
+        :meth:`config_doc`. Changes made to the dict in place are not picked up.
+        """
+        return self._config
+
+    @config.setter
+    def config(self, value: t.Dict) -> None:
+        self._config = value
+        self._config_doc = None
+        self._doc_dirty = True
+
+    def config_doc(self) -> t.Dict:
+        """Returns the job configuration serialized for the tracking document.
+
+        The result of ``parse_job_config(self.config, "write")`` is kept until
+        ``config`` is assigned again.
+
+        Returns:
+            dict: Serialized job configuration.
+
+        Examples:
+            >>> from unittest.mock import Mock
+            >>> backend = Mock()
+            >>> backend.get.return_value = {}
+            >>> job = Job(backend, "es-checkpoint", "test_job", {"query": {}})
+            >>> job.config_doc()
+            {'query': '{}'}
+            >>> job.config_doc() is job.config_doc()
+            True
+            >>> job.config = {"message": "hi"}
+            >>> job.config_doc()
+            {'message': 'hi'}
+        """
+        doc = self._config_doc
+        if doc is None:
+            doc = parse_job_config(self.config, "write")
+            self._config_doc = doc
+        return doc
+
     @begin_end()
     def get_history(self):
         """Retrieves the job's history from the tracking index.
 
         Uses the job name as the document ID to fetch previous run data, updating
-        configuration and status.
+        configuration and status. Without a prior tracking document, the file
+        config is used and the document ID stays the job name. Transient storage
+        failures are retried with STORAGE_RETRY.
 
         Examples:
             >>> from unittest.mock import Mock
@@ -124,32 +211,194 @@ class Job(Trackable):
             {'query': {'match_all': {}}}
         """
         args = (self.backend, self.tracking_index, self.name)
-        fn = get_tracking_doc
+        fn = _get_tracking_doc
         debug.lv4("TRY: get_tracking_doc()")
         result = self.fn_result(fn, args=args)
-        debug.lv5(f"get_tracking_doc() result = {result!r}")
+        if debug.level >= 5:
+            debug.lv5(f"get_tracking_doc() result = {result!r}")
+        if not result:
+            debug.lv3("No tracking doc found - using file config")
+            self.config = self.file_config
+            self.attr2status()
+            return
+        source = result.get("_source") or {}
         self.doc_id = result.get("_id", None)
-        self.status = result.get("_source", {})
-        config = result.get("_source", {}).get("config", None)
-        debug.lv5(f"Job config from tracking doc: {config!r}")
+        self.status = source
+        config = source.get("config", None)
+        if debug.level >= 5:
+            debug.lv5(f"Job config from tracking doc: {config!r}")
         if config is None:
             debug.lv3("No Job config found in tracking doc - using file config")
             self.config = self.file_config
         else:
             self.config = parse_job_config(config, "read")
-        debug.lv5(f"Current value of self.config: {self.config}")
-        self.prev_dry_run = result.get("_source", {}).get("dry_run", False)
+        if debug.level >= 5:
+            debug.lv5(f"Current value of self.config: {self.config}")
+        self.prev_dry_run = source.get("dry_run", False)
         if self.prev_dry_run:
             debug.lv3("Previous run was a dry run.")
             self.null2attr()
         else:
             self.attr2status()
-        debug.lv5(f"Job config = {self.config!r}")
+
+    def clear_tracking_cache(self) -> None:
+        """Discards preloaded step and task tracking docs.
+
+        The next Step of each task preloads the step docs of its task again.
+
+        Examples:
+            >>> from unittest.mock import Mock
+            >>> backend = Mock()
+            >>> backend.get.return_value = {}
+            >>> backend.search.return_value = [{"_id": "d1", "_source": {"step": "s1"}}]
+            >>> job = Job(backend, "es-checkpoint", "test_job", {})
+            >>> job.preload_step_history("task1")
+            >>> job.step_history("task1", "s1")
+            {'_id': 'd1', '_source': {'step': 's1'}}
+            >>> job.clear_tracking_cache()
+            >>> job.step_history("task1", "s1")
+            {'_id': 'd1', '_source': {'step': 's1'}}
+            >>> backend.search.call_count
+            2
+        """
+        self._history_cache.clear()
+        self._preloaded_tasks.clear()
+        self._history_seen.clear()
+
+    @begin_end()
+    def preload_step_history(self, task_id: str) -> None:
+        """Fetches the tracking docs of every step of a task in one search.
+
+        Steps created afterwards for this task take their history from the
+        preloaded docs instead of searching the tracking index one at a time.
+        :meth:`step_history` calls this for the first step of each task.
+
+        Args:
+            task_id: Task ID whose step docs should be preloaded.
+
+        Examples:
+            >>> from unittest.mock import Mock
+            >>> backend = Mock()
+            >>> backend.get.return_value = {}
+            >>> backend.search.return_value = [
+            ...     {"_id": "d1", "_source": {"step": "s1", "completed": True}}
+            ... ]
+            >>> job = Job(backend, "es-checkpoint", "test_job", {})
+            >>> job.preload_step_history("task1")
+            >>> job.step_history("task1", "s1")["_source"]
+            {'step': 's1', 'completed': True}
+            >>> job.step_history("task1", "s2")
+            {}
+            >>> backend.search.call_count
+            1
+        """
+        args = (self.backend, self.tracking_index, self.name, task_id)
+        debug.lv4("TRY: step_docs_req()")
+        result = self.fn_result(step_docs_req, args=args)
+        for stepname, doc in result.items():
+            self._history_cache[(task_id, stepname)] = doc
+        self._preloaded_tasks.add(task_id)
+
+    def preload_task_history(self, task_ids: t.Iterable[str]) -> None:
+        """Fetches the tracking docs of several tasks with one multi-search.
+
+        Call this before creating the tasks of a job, so each Task takes its
+        history from :meth:`task_history` instead of searching on its own.
+        Tasks whose docs are already preloaded are not fetched again.
+
+        Args:
+            task_ids: Task IDs whose tracking docs should be preloaded.
+
+        Examples:
+            >>> from unittest.mock import Mock
+            >>> backend = Mock()
+            >>> backend.get.return_value = {}
+            >>> backend.msearch.return_value = [
+            ...     [{"_id": "d1", "_source": {"task": "t1"}}], []
+            ... ]
+            >>> job = Job(backend, "es-checkpoint", "test_job", {})
+            >>> job.preload_task_history(["t1", "t2"])
+            >>> job.preload_task_history(["t1"])
+            >>> job.task_history("t1")
+            {'_id': 'd1', '_source': {'task': 't1'}}
+            >>> job.task_history("t2")
+            {}
+            >>> backend.msearch.call_count
+            1
+        """
+        specs = [
+            (task_id, "")
+            for task_id in task_ids
+            if (task_id, "") not in self._history_cache
+        ]
+        if not specs:
+            return
+        args = (self.backend, self.tracking_index, self.name, specs)
+        kwargs = {"source_includes": Trackable.ATTRLIST}
+        debug.lv4("TRY: progress_docs_bulk()")
+        result = self.fn_result(progress_docs_bulk, args=args, kwargs=kwargs)
+        self._history_cache.update(result)
+
+    def task_history(self, task_id: str) -> t.Optional[t.Dict]:
+        """Removes and returns the preloaded tracking doc of a task.
+
+        Args:
+            task_id: Task ID of the task.
+
+        Returns:
+            Optional[dict]: The preloaded doc, an empty dict if the task had no
+            doc, or None if it was not preloaded or was already looked up.
+
+        Examples:
+            >>> from unittest.mock import Mock
+            >>> backend = Mock()
+            >>> backend.get.return_value = {}
+            >>> job = Job(backend, "es-checkpoint", "test_job", {})
+            >>> job.task_history("task1") is None
+            True
+        """
+        return self._history_cache.pop((task_id, ""), None)
+
+    def step_history(self, task_id: str, stepname: str) -> t.Optional[t.Dict]:
+        """Removes and returns the preloaded tracking doc of a step.
+
+        Preloads the step docs of the task first if that has not been done yet.
+        Each step is answered from the preload once. A later Step with the same
+        name may have written its doc since, so it gets None and must search.
+
+        Args:
+            task_id: Task ID of the step.
+            stepname: Name of the step.
+
+        Returns:
+            Optional[dict]: The preloaded doc, an empty dict if the step had no
+            doc, or None if the step was already looked up.
+
+        Examples:
+            >>> from unittest.mock import Mock
+            >>> backend = Mock()
+            >>> backend.get.return_value = {}
+            >>> backend.search.return_value = []
+            >>> job = Job(backend, "es-checkpoint", "test_job", {})
+            >>> job.step_history("task1", "s1")
+            {}
+            >>> job.step_history("task1", "s1") is None
+            True
+        """
+        if task_id not in self._preloaded_tasks:
+            self.preload_step_history(task_id)
+        key = (task_id, stepname)
+        if key in self._history_seen:
+            return None
+        self._history_seen.add(key)
+        return self._history_cache.pop(key, {})
 
     @begin_end()
     def chk_idx(self) -> None:
         """Ensures the tracking index exists, creating it if necessary.
 
+        Transient storage failures are retried with STORAGE_RETRY.
+
         Examples:
             >>> from unittest.mock import Mock
             >>> backend = Mock()
@@ -162,11 +411,13 @@ class Job(Trackable):
         debug.lv2("BEGIN chk_idx()")
         create_index(self.backend, self.tracking_index)
 
-    @try_except(exceptions=ClientError, use=FatalError)
+    @try_except(exceptions=ClientError, use=FatalError, retry=STORAGE_RETRY)
     @begin_end()
     def mk_idx(self) -> None:
         """Creates the tracking index for the job.
 
+        Transient storage failures are retried with STORAGE_RETRY.
+
         Raises:
             FatalError: If the index creation fails.
 
@@ -181,5 +432,6 @@ class Job(Trackable):
         """
         args = (self.backend, self.tracking_index)
         kwargs = {"settings": index_settings(), "mappings": status_mappings()}
-        debug.lv5(f"Args: {args}, Kwargs: {kwargs}")
+        if debug.level >= 5:
+            debug.lv5(f"Args: {args}, Kwargs: {kwargs}")
         create_index(*args, **kwargs)
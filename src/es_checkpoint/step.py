@@ -10,6 +10,7 @@ import typing as t
 from ._parent import TaskOrStep
 from .debug import debug, begin_end
 from .exceptions import ClientError, MissingDocument
+from .storage import new_doc_id
 
 if t.TYPE_CHECKING:
     from .task import Task
@@ -38,7 +39,8 @@ class Step(TaskOrStep):
 
     Examples:
         >>> from unittest.mock import Mock
-        >>> job = Mock(name="job1", backend=Mock(), tracking_index="es-checkpoint")
+        >>> job = Mock(backend=Mock(), tracking_index="es-checkpoint")
+        >>> job.name = "job1"
         >>> task = Mock(job=job, index="test_idx", task_id="task1")
         >>> step = Step(task, "step1")
         >>> step.stepname
@@ -47,10 +49,13 @@ class Step(TaskOrStep):
         'Step: step1 of Task: task1 of Job: job1'
     """
 
+    # Every attribute is declared by Trackable and TaskOrStep
+    __slots__ = ()
+
     def __init__(self, task: "Task", stepname: str) -> None:
         debug.lv2("Initializing Step object")
-        self.stepname = stepname
         super().__init__(task.job, task.index)
+        self.stepname = stepname
         self.task_id = task.task_id
         self.stub = (
             f"Step: {self.stepname} of Task: {self.task_id} of Job: {task.job.name}"
@@ -70,7 +75,8 @@ class Step(TaskOrStep):
 
         Examples:
             >>> from unittest.mock import Mock
-            >>> job = Mock(name="job1", backend=Mock(), tracking_index="es-checkpoint")
+            >>> job = Mock(backend=Mock(), tracking_index="es-checkpoint")
+            >>> job.name = "job1"
             >>> task = Mock(job=job, index="test_idx", task_id="task1")
             >>> step = Step(task, "step1")
             >>> fields = step.extra_fields()
@@ -81,7 +87,8 @@ class Step(TaskOrStep):
             >>> fields["task"]
             'task1'
         """
-        debug.lv3(f"Building Step extra fields for {self.stepname}")
+        if debug.level >= 3:
+            debug.lv3(f"Building Step extra fields for {self.stepname}")
         return super().extra_fields()
 
     @begin_end()
@@ -98,21 +105,25 @@ class Step(TaskOrStep):
         Examples:
             >>> from unittest.mock import Mock
             >>> backend = Mock()
-            >>> backend.save.return_value = "step1_doc"
-            >>> job = Mock(name="job1", backend=backend, tracking_index="es-checkpoint")
+            >>> job = Mock(backend=backend, tracking_index="es-checkpoint")
+            >>> job.name = "job1"
             >>> task = Mock(job=job, index="test_idx", task_id="task1")
             >>> step = Step(task, "step1")
+            >>> step.doc_id = None
             >>> step.update_status("running")
-            >>> backend.save.called
+            >>> job.queue_save.called
             True
         """
         if not status:
             raise ValueError("Status cannot be empty")
-        debug.lv3(f"Updating status for {self.stub} to {status}")
+        if debug.level >= 3:
+            debug.lv3(f"Updating status for {self.stub} to {status}")
         try:
             doc = self.build_doc()
             doc["status"] = status
-            self.backend.save(self.tracking_index, self.doc_id, doc)
+            if not self.doc_id:
+                self.doc_id = new_doc_id()
+            self.save_buffer().queue_save(self.tracking_index, self.doc_id, doc)
             logger.info(f"Updated status for {self.stub} to {status}")
         except ClientError as err:
             logger.error(f"Failed to update status for {self.stub}: {err}")
@@ -129,7 +140,8 @@ class Step(TaskOrStep):
             >>> from unittest.mock import Mock
             >>> backend = Mock()
             >>> backend.get.return_value = {"status": "running"}
-            >>> job = Mock(name="job1", backend=backend, tracking_index="es-checkpoint")
+            >>> job = Mock(backend=backend, tracking_index="es-checkpoint")
+            >>> job.name = "job1"
             >>> task = Mock(job=job, index="test_idx", task_id="task1")
             >>> step = Step(task, "step1")
             >>> step.doc_id = "step1_doc"
@@ -137,14 +149,17 @@ class Step(TaskOrStep):
             >>> status
             'running'
         """
-        debug.lv3(f"Retrieving status for {self.stub}")
+        if debug.level >= 3:
+            debug.lv3(f"Retrieving status for {self.stub}")
         try:
             if not self.doc_id:
                 debug.lv5("No doc_id set, returning None")
                 return None
+            self.save_buffer().flush()
             doc = self.backend.get(self.tracking_index, self.doc_id)
             status = doc.get("status")
-            debug.lv5(f"Retrieved status: {status}")
+            if debug.level >= 5:
+                debug.lv5(f"Retrieved status: {status}")
             return status
         except MissingDocument:
             debug.lv5("Step document not found")
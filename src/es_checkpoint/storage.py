@@ -6,13 +6,381 @@ Elasticsearch, local file, and in-memory storage.
 
 # pylint: disable=W0107
 import typing as t
+import copy
 import json
-import uuid
+import logging
+import os
+import queue
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from elasticsearch8 import Elasticsearch
+from dotmap import DotMap  # type: ignore
+from elasticsearch8 import Elasticsearch, NotFoundError
+from elasticsearch8.helpers import bulk, parallel_bulk
 from .exceptions import MissingDocument, MissingIndex, ClientError
 
+try:
+    import orjson
+
+    # elasticsearch8 only defines OrjsonSerializer when orjson can be imported
+    from elasticsearch8.serializer import OrjsonSerializer
+except ImportError:  # pragma: no cover
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(obj: t.Any) -> t.Any:
+    """Converts values JSON has no type for, such as those in Task.data.
+
+    Shared by both serializers, so orjson and the standard library encode
+    documents the same way. orjson passes subclasses of dict, list, str, and int
+    here too, because it would otherwise read their storage directly and write a
+    DotMap, which keeps its keys elsewhere, as {}.
+
+    Examples:
+        >>> from datetime import date
+        >>> _json_default(DotMap({"key": "value"}))
+        {'key': 'value'}
+        >>> _json_default({2, 1})
+        [1, 2]
+        >>> _json_default(date(2023, 1, 1))
+        '2023-01-01'
+    """
+    if isinstance(obj, DotMap):
+        return obj.toDict()
+    for base in (dict, list, str, int):
+        if isinstance(obj, base):
+            return base(obj)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+
+    def _json_dumps(obj: t.Any) -> bytes:
+        """Serializes to JSON bytes with orjson."""
+        return orjson.dumps(
+            obj, default=_json_default, option=orjson.OPT_PASSTHROUGH_SUBCLASS
+        )
+
+    _json_loads = orjson.loads
+else:  # pragma: no cover
+    _JSON_ENCODER = json.JSONEncoder(default=_json_default)
+
+    def _json_dumps(obj: t.Any) -> bytes:
+        """Serializes to UTF-8 JSON bytes with the standard library."""
+        return _JSON_ENCODER.encode(obj).encode("utf-8")
+
+    def _json_loads(data: bytes) -> t.Any:
+        """Deserializes JSON bytes with the standard library."""
+        return json.loads(data)
+
+
+@lru_cache(maxsize=None)
+def get_default_client(
+    hosts: t.Tuple[str, ...],
+    pool_maxsize: int = 25,
+    request_timeout: float = 30.0,
+    http_compress: bool = True,
+) -> Elasticsearch:
+    """Returns a shared Elasticsearch client for a set of hosts.
+
+    Clients are created once per distinct set of arguments and reused, so every
+    backend built from the same hosts shares one connection pool and its
+    keep-alive connections. Request bodies are gzip compressed by default:
+    tracking documents are JSON, which compresses several times over, and bulk
+    writes are mostly bound by the bytes sent. When orjson is installed,
+    requests and responses are serialized with it instead of the json module.
+
+    Args:
+        hosts: Elasticsearch node URLs, as a tuple so they can be cached.
+        pool_maxsize: Maximum connections per node (default: 25).
+        request_timeout: Request timeout in seconds (default: 30.0).
+        http_compress: Whether to gzip request bodies (default: True).
+
+    Returns:
+        Elasticsearch: Shared client instance.
+
+    Examples:
+        >>> client = get_default_client(("http://localhost:9200",))
+        >>> client is get_default_client(("http://localhost:9200",))
+        True
+    """
+    return Elasticsearch(
+        list(hosts),
+        connections_per_node=pool_maxsize,
+        request_timeout=request_timeout,
+        http_compress=http_compress,
+        serializer=OrjsonSerializer() if orjson is not None else None,
+    )
+
+
+def _http_compress(client: Elasticsearch) -> t.Optional[bool]:
+    """Returns whether a client compresses request bodies, or None if unknown.
+
+    Examples:
+        >>> _http_compress(Elasticsearch("http://localhost:9200"))
+        False
+        >>> _http_compress(get_default_client(("http://localhost:9200",)))
+        True
+    """
+    try:
+        return all(
+            node.config.http_compress for node in client.transport.node_pool.all()
+        )
+    except (AttributeError, TypeError):
+        return None
+
+
+def new_doc_id() -> str:
+    """Generates an ID for a new tracking document.
+
+    Trackers assign IDs to new documents themselves, so that their first save
+    can be buffered and bulk written like any other.
+
+    Returns:
+        str: 32 random hex digits, as random as a version 4 UUID.
+
+    Examples:
+        >>> len(new_doc_id())
+        32
+    """
+    return os.urandom(16).hex()
+
+
+def _as_list(clauses: t.Union[t.Dict, t.List[t.Dict]]) -> t.List[t.Dict]:
+    """Returns bool query clauses as a list, wrapping a single clause."""
+    return clauses if isinstance(clauses, list) else [clauses]
+
+
+def _compile_query(query: t.Dict) -> t.Callable[[t.Dict], bool]:
+    """Compiles a query into a predicate for the local backends.
+
+    Supports ``term``, ``exists``, and ``bool`` queries with ``must``, ``filter``,
+    and ``must_not`` clauses. Other clauses, such as ``parent_id``, match every
+    document. The query is parsed once, so the predicate only does the
+    comparisons for each document.
+
+    Args:
+        query: Query dictionary.
+
+    Returns:
+        Callable: Predicate returning True for documents (or indexed metadata)
+        that match the query.
+
+    Examples:
+        >>> doc = {"job": "job1", "task": "task1"}
+        >>> _compile_query({"term": {"job": "job1"}})(doc)
+        True
+        >>> query = {"bool": {"filter": [{"term": {"job": "job1"}}]}}
+        >>> query["bool"]["must_not"] = {"exists": {"field": "task"}}
+        >>> _compile_query(query)(doc)
+        False
+    """
+    if "term" in query:
+        terms = tuple(query["term"].items())
+        if len(terms) == 1:
+            ((key, value),) = terms
+            return lambda doc: doc.get(key) == value
+        return lambda doc: all(doc.get(key) == value for key, value in terms)
+    if "exists" in query:
+        field = query["exists"]["field"]
+        return lambda doc: doc.get(field) is not None
+    if "bool" in query:
+        clauses = query["bool"]
+        required = tuple(
+            _compile_query(clause)
+            for key in ("must", "filter")
+            for clause in _as_list(clauses.get(key, []))
+        )
+        excluded = tuple(
+            _compile_query(clause) for clause in _as_list(clauses.get("must_not", []))
+        )
+        return lambda doc: all(pred(doc) for pred in required) and not any(
+            pred(doc) for pred in excluded
+        )
+    return lambda doc: True
+
+
+#: frozenset: Field value types kept in index files and term indices. Exact
+#: types, so one set lookup replaces an isinstance check per field
+_SCALAR_TYPES = frozenset((str, int, bool))
+
+
+def _scalar_fields(doc: t.Dict) -> t.Dict:
+    """Returns the fields of a document that the local backends index.
+
+    Examples:
+        >>> _scalar_fields({"job": "job1", "done": True, "logs": [], "end": None})
+        {'job': 'job1', 'done': True}
+    """
+    return {key: value for key, value in doc.items() if type(value) in _SCALAR_TYPES}
+
+
+def _required_terms(query: t.Dict) -> t.List[t.Tuple[str, t.Any]]:
+    """Lists the scalar term clauses that every matching document must satisfy.
+
+    Only top-level ``term`` queries and ``term`` clauses in ``bool`` ``must`` and
+    ``filter`` lists (at any depth) qualify.
+
+    Examples:
+        >>> query = {"bool": {"filter": [{"term": {"job": "job1"}}]}}
+        >>> _required_terms(query)
+        [('job', 'job1')]
+    """
+    if "term" in query:
+        return [
+            (key, value)
+            for key, value in query["term"].items()
+            if type(value) in _SCALAR_TYPES
+        ]
+    terms = []
+    if "bool" in query:
+        for key in ("must", "filter"):
+            for clause in _as_list(query["bool"].get(key, [])):
+                terms.extend(_required_terms(clause))
+    return terms
+
+
+class _TermIndex:
+    """Inverted index of scalar document fields for the local backends.
+
+    Maps each field and value to the IDs of the documents that have them, in
+    save order, so term queries only check the documents that can match.
+
+    Examples:
+        >>> terms = _TermIndex()
+        >>> terms.add("a", {"job": "job1", "task": "t1"})
+        >>> terms.add("b", {"job": "job1", "task": "t2"})
+        >>> terms.candidates({"term": {"job": "job1", "task": "t2"}})
+        ['b']
+        >>> terms.candidates({"exists": {"field": "task"}}) is None
+        True
+    """
+
+    __slots__ = ("postings",)
+
+    def __init__(self) -> None:
+        #: dict: Document IDs (dict keys, kept in save order) by field and value
+        self.postings: t.Dict[str, t.Dict[t.Any, t.Dict[str, None]]] = {}
+
+    def add(self, doc_id: str, metadata: t.Dict) -> None:
+        """Indexes the scalar fields of a document."""
+        for key, value in metadata.items():
+            if type(value) in _SCALAR_TYPES:
+                self.postings.setdefault(key, {}).setdefault(value, {})[doc_id] = None
+
+    def remove(self, doc_id: str, metadata: t.Dict) -> None:
+        """Removes a document, as previously indexed with metadata."""
+        for key, value in metadata.items():
+            if type(value) in _SCALAR_TYPES:
+                self.postings.get(key, {}).get(value, {}).pop(doc_id, None)
+
+    def candidates(self, query: t.Dict) -> t.Optional[t.List[str]]:
+        """Returns the IDs of documents that satisfy the query's term clauses.
+
+        Args:
+            query: Query dictionary.
+
+        Returns:
+            Optional[list[str]]: Candidate document IDs, which must still be
+            checked with _compile_query, or None if the query has no term clauses
+            to narrow the search.
+        """
+        terms = _required_terms(query)
+        if not terms:
+            return None
+        lists = [self.postings.get(key, {}).get(value, {}) for key, value in terms]
+        lists.sort(key=len)
+        smallest, others = lists[0], lists[1:]
+        return [
+            doc_id
+            for doc_id in smallest
+            if all(doc_id in doc_ids for doc_ids in others)
+        ]
+
+
+class _WriteBehind:
+    """Writes document files for FileBackend on a background thread.
+
+    Documents waiting to be written stay readable through get. put blocks while
+    the queue is full, so a caller that outpaces the disk slows down instead of
+    queueing without bound. A failed write is raised by the next put or join.
+
+    Args:
+        maxsize: Maximum number of queued writes.
+
+    Examples:
+        >>> import tempfile
+        >>> path = Path(tempfile.mkdtemp()) / "doc1.json"
+        >>> writer = _WriteBehind(16)
+        >>> writer.put(path, {"field": "value"})
+        >>> writer.join()
+        >>> json.loads(path.read_bytes())
+        {'field': 'value'}
+        >>> writer.get(path) is None
+        True
+    """
+
+    __slots__ = ("queue", "lock", "in_flight", "errors", "thread")
+
+    def __init__(self, maxsize: int) -> None:
+        self.queue: "queue.Queue[t.Tuple[Path, t.Dict]]" = queue.Queue(maxsize)
+        self.lock = threading.Lock()
+        #: dict: Documents queued or being written, by file path
+        self.in_flight: t.Dict[Path, t.Dict] = {}
+        #: list: Errors from failed writes, not yet raised
+        self.errors: t.List[Exception] = []
+        self.thread = threading.Thread(
+            target=self._run, name="es-checkpoint-file-writer", daemon=True
+        )
+        self.thread.start()
+
+    def _run(self) -> None:
+        while True:
+            path, doc = self.queue.get()
+            try:
+                path.write_bytes(_json_dumps(doc))
+            except Exception as err:  # pylint: disable=W0718
+                self.errors.append(err)
+            finally:
+                with self.lock:
+                    if self.in_flight.get(path) is doc:
+                        del self.in_flight[path]
+                self.queue.task_done()
+
+    def _raise_error(self) -> None:
+        if self.errors:
+            err = self.errors.pop(0)
+            raise ClientError(f"Error writing document: {str(err)}", errors=err)
+
+    def put(self, path: Path, doc: t.Dict) -> None:
+        """Queues a document to be written to path."""
+        self._raise_error()
+        with self.lock:
+            self.in_flight[path] = doc
+        self.queue.put((path, doc))
+
+    def get(self, path: Path) -> t.Optional[t.Dict]:
+        """Returns the document waiting to be written to path, if any."""
+        with self.lock:
+            return self.in_flight.get(path)
+
+    def join(self) -> None:
+        """Waits until every queued document is written."""
+        self.queue.join()
+        self._raise_error()
+
 
 class StorageBackend(ABC):
     """Abstract base class for storage backends.
@@ -39,6 +407,44 @@ class StorageBackend(ABC):
         """
         pass
 
+    def bulk_save(self, docs: t.List[t.Tuple[str, str, t.Dict]]) -> None:
+        """Saves or updates several documents with known IDs.
+
+        The default implementation calls save for each document. Backends with a
+        batch API should override it.
+
+        Args:
+            docs: List of (index, doc_id, doc) tuples.
+
+        Raises:
+            MissingIndex: If an index does not exist.
+            ClientError: If a save operation fails.
+        """
+        for index, doc_id, doc in docs:
+            self.save(index, doc_id, doc)
+
+    def invalidate_index_cache(self, index: t.Optional[str] = None) -> None:
+        """Forgets that an index is known to exist.
+
+        Backends that remember which indices ensure_index has seen override this.
+        Call it after deleting an index outside the backend. The default
+        implementation does nothing.
+
+        Args:
+            index: Index or container name, or None to forget all indices.
+        """
+        pass
+
+    def refresh(self, index: str) -> None:
+        """Makes recent writes to an index visible to searches.
+
+        The default implementation does nothing, as writes are visible at once.
+
+        Args:
+            index: Index or container name.
+        """
+        pass
+
     @abstractmethod
     def get(self, index: str, doc_id: str) -> t.Dict:
         """Retrieves a document by ID.
@@ -58,7 +464,12 @@ class StorageBackend(ABC):
 
     @abstractmethod
     def search(
-        self, index: str, query: t.Dict, size: int = 0, **kwargs
+        self,
+        index: str,
+        query: t.Dict,
+        size: int = 0,
+        with_ids: bool = False,
+        **kwargs,
     ) -> t.List[t.Dict]:
         """Searches documents in the index.
 
@@ -66,6 +477,8 @@ class StorageBackend(ABC):
             index: Index or container name.
             query: Search query (backend-specific format).
             size: Maximum number of results (0 for all).
+            with_ids: Return each match as {"_id": doc_id, "_source": doc}
+                instead of the bare document (default: False).
             **kwargs: Additional arguments (backend-specific).
 
         Returns:
@@ -76,6 +489,39 @@ class StorageBackend(ABC):
         """
         pass
 
+    def msearch(
+        self,
+        index: str,
+        queries: t.List[t.Dict],
+        size: int = 0,
+        source_includes: t.Optional[t.Sequence[str]] = None,
+        with_ids: bool = False,
+    ) -> t.List[t.List[t.Dict]]:
+        """Runs several searches against one index.
+
+        The default calls search for each query. Backends override it when they
+        can send all queries in one request.
+
+        Args:
+            index: Index or container name.
+            queries: Search queries (backend-specific format).
+            size: Maximum number of results per query (0 for all).
+            source_includes: Fields to return, for backends that can filter
+                document sources (default: None, all fields).
+            with_ids: Return matches as in search with with_ids (default: False).
+
+        Returns:
+            list[list[dict]]: Matching documents for each query, in query order.
+
+        Raises:
+            MissingIndex: If the index does not exist.
+        """
+        kwargs = {"source_includes": source_includes} if source_includes else {}
+        return [
+            self.search(index, query, size, with_ids=with_ids, **kwargs)
+            for query in queries
+        ]
+
     @abstractmethod
     def ensure_index(self, index: str, **kwargs) -> None:
         """Ensures an index exists, creating it if necessary.
@@ -89,14 +535,72 @@ class StorageBackend(ABC):
         """
         pass
 
+    def ensure_indices(self, indices: t.Iterable[str], **kwargs) -> None:
+        """Ensures several indices exist, creating any that are missing.
+
+        The default calls ensure_index for each index. Backends override it when
+        they can check several indices at once.
+
+        Args:
+            indices: Index or container names.
+            **kwargs: Additional arguments for every index (backend-specific).
+
+        Raises:
+            ClientError: If index creation fails.
+        """
+        for index in indices:
+            self.ensure_index(index, **kwargs)
+
+
+#: str: Error type of a 404 response for a missing index
+_INDEX_NOT_FOUND = "index_not_found_exception"
+#: str: Response fields search needs. Elasticsearch drops the rest before sending
+_SEARCH_FILTER = "hits.hits._id,hits.hits._source"
+#: str: Response fields msearch needs. status keeps every response in place
+_MSEARCH_FILTER = (
+    "responses.status,responses.error,responses.hits.hits._id,"
+    "responses.hits.hits._source"
+)
+
+
+def _hit_results(hits: t.Iterable[t.Dict], with_ids: bool) -> t.List[t.Dict]:
+    """Returns the sources of search hits, or their IDs and sources."""
+    if with_ids:
+        return [{"_id": hit["_id"], "_source": hit["_source"]} for hit in hits]
+    return [hit["_source"] for hit in hits]
+
 
 class ElasticsearchBackend(StorageBackend):
     """Elasticsearch storage backend.
 
     Uses an Elasticsearch client to store and retrieve tracking documents.
 
+    Share one client across the process: each client owns a connection pool,
+    and every new client pays for new TCP and TLS handshakes. Pass hosts
+    instead of a client to use the shared client from get_default_client.
+
+    Clients should be created with http_compress=True, as get_default_client
+    does. A warning is logged for a client that is known not to compress.
+
     Args:
-        client: Elasticsearch client instance.
+        client: Elasticsearch client instance (default: None, requires hosts).
+        chunk_size: Maximum number of documents per bulk request (default: 500).
+        max_chunk_bytes: Maximum size of a bulk request in bytes (default: 10MiB).
+        refresh: Refresh parameter for writes (default: False). Searches refresh
+            an index first if it has writes that have not been refreshed.
+        refresh_interval: index.refresh_interval for indices this backend
+            creates, unless the settings passed set one (default: "30s").
+        hosts: Elasticsearch node URLs for get_default_client, used when no
+            client is passed (default: None).
+        pool_maxsize: Maximum connections per node for get_default_client
+            (default: 25).
+        thread_count: Number of threads sending bulk requests in bulk_save. More
+            than one uses parallel_bulk (default: 1).
+        queue_size: Number of chunks parallel_bulk prepares ahead of its threads
+            (default: 4).
+
+    Raises:
+        ValueError: If neither client nor hosts is provided.
 
     Examples:
         >>> from unittest.mock import Mock
@@ -106,8 +610,44 @@ class ElasticsearchBackend(StorageBackend):
         True
     """
 
-    def __init__(self, client: Elasticsearch):
+    def __init__(
+        self,
+        client: t.Optional[Elasticsearch] = None,
+        chunk_size: int = 500,
+        max_chunk_bytes: int = 10 * 1024 * 1024,
+        refresh: t.Union[bool, str] = False,
+        refresh_interval: str = "30s",
+        hosts: t.Optional[t.Sequence[str]] = None,
+        pool_maxsize: int = 25,
+        thread_count: int = 1,
+        queue_size: int = 4,
+    ):
+        if client is None:
+            if not hosts:
+                raise ValueError("Either client or hosts must be provided")
+            client = get_default_client(tuple(hosts), pool_maxsize=pool_maxsize)
+        elif _http_compress(client) is False:
+            logger.warning(
+                "Elasticsearch client does not compress request bodies. Create it "
+                "with http_compress=True to send less data in bulk writes"
+            )
         self.client = client
+        #: int: Maximum number of documents per bulk request
+        self.chunk_size = chunk_size
+        #: int: Maximum size of a bulk request in bytes
+        self.max_chunk_bytes = max_chunk_bytes
+        #: int: Number of threads sending bulk requests
+        self.thread_count = thread_count
+        #: int: Number of chunks parallel_bulk prepares ahead of its threads
+        self.queue_size = queue_size
+        #: bool | str: Refresh parameter for writes
+        self.refresh_writes = refresh
+        #: str: Refresh interval for created indices
+        self.refresh_interval = refresh_interval
+        #: set: Indices with writes that no refresh has made searchable yet
+        self._unrefreshed: t.Set[str] = set()
+        #: set: Indices known to exist, so ensure_index can skip the request
+        self._known_indices: t.Set[str] = set()
 
     def save(self, index: str, doc_id: t.Optional[str], doc: t.Dict, **kwargs) -> str:
         """Saves or updates a document in Elasticsearch.
@@ -137,6 +677,7 @@ class ElasticsearchBackend(StorageBackend):
             'doc1'
         """
         self.ensure_index(index)
+        kwargs.setdefault("refresh", self.refresh_writes)
         try:
             if doc_id:
                 self.client.update(
@@ -144,21 +685,155 @@ class ElasticsearchBackend(StorageBackend):
                     id=doc_id,
                     doc=doc,
                     doc_as_upsert=True,
-                    refresh=True,
                     **kwargs,
                 )
-                return doc_id
             else:
-                response = self.client.index(
-                    index=index, document=doc, refresh=True, **kwargs
-                )
-                return response["_id"]
+                response = self.client.index(index=index, document=doc, **kwargs)
+                doc_id = response["_id"]
         except Exception as err:
             raise ClientError(f"Error saving document: {str(err)}", errors=err) from err
+        if not kwargs["refresh"]:
+            self._unrefreshed.add(index)
+        return doc_id
+
+    @classmethod
+    def autotune(
+        cls,
+        avg_doc_size: int,
+        max_chunk_bytes: int = 50 * 1024 * 1024,
+        cpu_count: t.Optional[int] = None,
+    ) -> t.Dict[str, int]:
+        """Derives bulk settings from the average size of a tracking document.
+
+        A chunk holds at most max_chunk_bytes / avg_doc_size documents, so
+        chunk_size never asks for chunks that max_chunk_bytes would split anyway.
+        thread_count is capped at the number of CPUs, and at 8, since each thread
+        holds a chunk in memory. Up to (thread_count + queue_size) *
+        max_chunk_bytes bytes of requests can be in memory at once.
+
+        Args:
+            avg_doc_size: Average size of a tracking document in bytes.
+            max_chunk_bytes: Maximum size of a bulk request in bytes
+                (default: 50MiB).
+            cpu_count: Number of CPUs (default: None, uses os.cpu_count()).
+
+        Returns:
+            dict: chunk_size, max_chunk_bytes, thread_count, and queue_size
+            keyword arguments for the constructor.
+
+        Examples:
+            >>> ElasticsearchBackend.autotune(2048, max_chunk_bytes=1024**2,
+            ...     cpu_count=4)  # doctest: +NORMALIZE_WHITESPACE
+            {'chunk_size': 512, 'max_chunk_bytes': 1048576, 'thread_count': 4,
+             'queue_size': 4}
+        """
+        return {
+            "chunk_size": max(1, max_chunk_bytes // max(1, avg_doc_size)),
+            "max_chunk_bytes": max_chunk_bytes,
+            "thread_count": max(1, min(cpu_count or os.cpu_count() or 1, 8)),
+            "queue_size": 4,
+        }
+
+    def bulk_save(self, docs: t.List[t.Tuple[str, str, t.Dict]]) -> None:
+        """Upserts several documents with Elasticsearch bulk requests.
+
+        The documents are split into requests of at most chunk_size documents
+        and max_chunk_bytes bytes, sent by thread_count threads.
+
+        Args:
+            docs: List of (index, doc_id, doc) tuples.
+
+        Raises:
+            ClientError: If the bulk request fails.
+
+        Examples:
+            >>> from unittest.mock import Mock, patch
+            >>> client = Mock(spec=Elasticsearch)
+            >>> client.indices = Mock()
+            >>> client.indices.exists.return_value = True
+            >>> backend = ElasticsearchBackend(client)
+            >>> with patch("es_checkpoint.storage.bulk") as mock_bulk:
+            ...     backend.bulk_save([("test_idx", "doc1", {"field": "value"})])
+            ...     mock_bulk.call_args[0][1][0]["_op_type"]
+            'update'
+        """
+        self.ensure_indices(index for index, _, _ in docs)
+        actions = [
+            {
+                "_op_type": "update",
+                "_index": index,
+                "_id": doc_id,
+                "doc": doc,
+                "doc_as_upsert": True,
+            }
+            for index, doc_id, doc in docs
+        ]
+        try:
+            if self.thread_count > 1:
+                for _ in parallel_bulk(
+                    self.client,
+                    actions,
+                    thread_count=self.thread_count,
+                    queue_size=self.queue_size,
+                    chunk_size=self.chunk_size,
+                    max_chunk_bytes=self.max_chunk_bytes,
+                    refresh=self.refresh_writes,
+                ):
+                    pass
+            else:
+                bulk(
+                    self.client,
+                    actions,
+                    chunk_size=self.chunk_size,
+                    max_chunk_bytes=self.max_chunk_bytes,
+                    refresh=self.refresh_writes,
+                )
+        except Exception as err:
+            raise ClientError(
+                f"Error saving documents: {str(err)}", errors=err
+            ) from err
+        if not self.refresh_writes:
+            self._unrefreshed.update(index for index, _, _ in docs)
+
+    def refresh(self, index: str) -> None:
+        """Refreshes an index if it has writes that are not yet searchable.
+
+        Args:
+            index: Index name.
+
+        Raises:
+            ClientError: If the refresh fails.
+
+        Examples:
+            >>> from unittest.mock import Mock
+            >>> client = Mock(spec=Elasticsearch)
+            >>> client.indices = Mock()
+            >>> client.indices.exists.return_value = True
+            >>> backend = ElasticsearchBackend(client)
+            >>> backend.refresh("test_idx")
+            >>> client.indices.refresh.called
+            False
+            >>> _ = backend.save("test_idx", "doc1", {"field": "value"})
+            >>> backend.refresh("test_idx")
+            >>> client.indices.refresh.call_args.kwargs
+            {'index': 'test_idx'}
+        """
+        if index not in self._unrefreshed:
+            return
+        try:
+            self.client.indices.refresh(index=index)
+        except Exception as err:
+            raise ClientError(
+                f"Error refreshing index: {str(err)}", errors=err
+            ) from err
+        self._unrefreshed.discard(index)
 
     def get(self, index: str, doc_id: str) -> t.Dict:
         """Retrieves a document by ID from Elasticsearch.
 
+        The document is requested directly, without checking the index first. A
+        404 response tells a missing index from a missing document.
+
         Args:
             index: Index name.
             doc_id: Document ID.
@@ -169,35 +844,53 @@ class ElasticsearchBackend(StorageBackend):
         Raises:
             MissingIndex: If the index does not exist.
             MissingDocument: If the document is not found.
+            ClientError: If the request fails otherwise.
 
         Examples:
             >>> from unittest.mock import Mock
             >>> client = Mock(spec=Elasticsearch)
-            >>> client.indices.exists.return_value = True
             >>> client.get.return_value = {"_source": {"field": "value"}}
             >>> backend = ElasticsearchBackend(client)
             >>> doc = backend.get("test_idx", "doc1")
             >>> doc["field"]
             'value'
         """
-        self.ensure_index(index)
         try:
             response = self.client.get(index=index, id=doc_id)
-            return response["_source"]
-        except Exception as err:
+        except NotFoundError as err:
+            error = err.body.get("error") if isinstance(err.body, dict) else None
+            if isinstance(error, dict) and error.get("type") == _INDEX_NOT_FOUND:
+                raise MissingIndex(
+                    f"Index {index} does not exist", index=index
+                ) from err
             raise MissingDocument(
                 f"Document {doc_id} not found in {index}", index=index
             ) from err
+        except Exception as err:
+            raise ClientError(
+                f"Error retrieving document: {str(err)}", errors=err
+            ) from err
+        return response["_source"]
 
     def search(
-        self, index: str, query: t.Dict, size: int = 0, **kwargs
+        self,
+        index: str,
+        query: t.Dict,
+        size: int = 0,
+        with_ids: bool = False,
+        **kwargs,
     ) -> t.List[t.Dict]:
         """Searches documents in Elasticsearch.
 
+        Responses are trimmed to the hit IDs and sources with filter_path unless
+        another filter_path is passed.
+
         Args:
             index: Index name.
             query: Elasticsearch DSL query.
             size: Maximum number of results (0 for all).
+            with_ids: Return each match as {"_id": doc_id, "_source": doc}
+                instead of the bare document (default: False).
             **kwargs: Additional arguments (e.g., aggs).
 
         Returns:
@@ -220,9 +913,16 @@ class ElasticsearchBackend(StorageBackend):
             1
             >>> results[0]["field"]
             'value'
+            >>> client.search.return_value = {
+            ...     "hits": {"hits": [{"_id": "d1", "_source": {"field": "value"}}]}
+            ... }
+            >>> backend.search("test_idx", {"match_all": {}}, with_ids=True)
+            [{'_id': 'd1', '_source': {'field': 'value'}}]
         """
         self.ensure_index(index)
+        self.refresh(index)
         try:
+            kwargs.setdefault("filter_path", _SEARCH_FILTER)
             kwargs.update(
                 {
                     "index": index,
@@ -232,15 +932,92 @@ class ElasticsearchBackend(StorageBackend):
                 }
             )
             response = self.client.search(**kwargs)
-            return [hit["_source"] for hit in response["hits"]["hits"]]
+            # filter_path drops "hits" altogether when nothing matched
+            hits = response.get("hits", {}).get("hits", ())
+            return _hit_results(hits, with_ids)
         except Exception as err:
             raise ClientError(
                 f"Error searching documents: {str(err)}", errors=err
             ) from err
 
+    def msearch(
+        self,
+        index: str,
+        queries: t.List[t.Dict],
+        size: int = 0,
+        source_includes: t.Optional[t.Sequence[str]] = None,
+        with_ids: bool = False,
+    ) -> t.List[t.List[t.Dict]]:
+        """Runs several searches against one index with a single msearch request.
+
+        Args:
+            index: Index name.
+            queries: Elasticsearch DSL queries.
+            size: Maximum number of results per query (0 for all).
+            source_includes: Fields of _source to return (default: None, all).
+            with_ids: Return matches as in search with with_ids (default: False).
+
+        Returns:
+            list[list[dict]]: Matching documents for each query, in query order.
+
+        Raises:
+            MissingIndex: If the index does not exist.
+            ClientError: If the request or any of its searches fails.
+
+        Examples:
+            >>> from unittest.mock import Mock
+            >>> client = Mock(spec=Elasticsearch)
+            >>> client.indices = Mock()
+            >>> client.indices.exists.return_value = True
+            >>> client.msearch.return_value = {
+            ...     "responses": [
+            ...         {"hits": {"hits": [{"_source": {"task": "t1"}}]}},
+            ...         {"hits": {"hits": []}},
+            ...     ]
+            ... }
+            >>> backend = ElasticsearchBackend(client)
+            >>> backend.msearch("test_idx", [{"term": {"task": "t1"}}] * 2)
+            [[{'task': 't1'}], []]
+            >>> len(client.msearch.call_args.kwargs["searches"])
+            4
+        """
+        if not queries:
+            return []
+        self.ensure_index(index)
+        self.refresh(index)
+        header = {"index": index, "expand_wildcards": ["open", "hidden"]}
+        searches: t.List[t.Dict] = []
+        for query in queries:
+            body = {"query": query, "size": size}
+            if source_includes:
+                body["_source"] = {"includes": list(source_includes)}
+            searches.extend((header, body))
+        try:
+            response = self.client.msearch(
+                searches=searches, filter_path=_MSEARCH_FILTER
+            )
+        except Exception as err:
+            raise ClientError(
+                f"Error searching documents: {str(err)}", errors=err
+            ) from err
+        results = []
+        for item in response["responses"]:
+            if "error" in item:
+                raise ClientError(
+                    f"Error searching documents: {item['error']}",
+                    errors=item["error"],
+                )
+            hits = item.get("hits", {}).get("hits", ())
+            results.append(_hit_results(hits, with_ids))
+        return results
+
     def ensure_index(self, index: str, **kwargs) -> None:
         """Ensures an index exists in Elasticsearch, creating it if necessary.
 
+        A created index gets the backend's refresh_interval unless the settings
+        passed already set index.refresh_interval. Indices found or created are
+        remembered, and not checked again until invalidate_index_cache is called.
+
         Args:
             index: Index name.
             **kwargs: Additional arguments (e.g., settings, mappings).
@@ -258,26 +1035,119 @@ class ElasticsearchBackend(StorageBackend):
             >>> client.indices.create.called
             True
         """
+        if index not in self._known_indices:
+            self.ensure_indices([index], **kwargs)
+
+    def ensure_indices(self, indices: t.Iterable[str], **kwargs) -> None:
+        """Ensures several indices exist in Elasticsearch, creating any missing.
+
+        Indices not already known to exist are checked with a single exists
+        request. Only when some of them are missing is each one checked, and
+        created if needed, as in ensure_index.
+
+        Args:
+            indices: Index names.
+            **kwargs: Additional arguments for every index (e.g., settings,
+                mappings).
+
+        Raises:
+            ClientError: If index creation fails.
+
+        Examples:
+            >>> from unittest.mock import Mock
+            >>> client = Mock(spec=Elasticsearch)
+            >>> client.indices = Mock()
+            >>> client.indices.exists.return_value = True
+            >>> backend = ElasticsearchBackend(client)
+            >>> backend.ensure_indices(["idx1", "idx2", "idx1"])
+            >>> client.indices.exists.call_args.kwargs["index"]
+            'idx1,idx2'
+            >>> backend.ensure_indices(["idx1", "idx2"])
+            >>> client.indices.exists.call_count
+            1
+        """
+        expand = ["open", "hidden"]
+        unknown = [i for i in dict.fromkeys(indices) if i not in self._known_indices]
+        if not unknown:
+            return
         try:
-            if not self.client.indices.exists(
-                index=index, expand_wildcards=["open", "hidden"]
+            # exists is True for several indices only if all of them exist
+            if len(unknown) > 1 and self.client.indices.exists(
+                index=",".join(unknown), expand_wildcards=expand
             ):
-                settings = kwargs.get("settings")
-                mappings = kwargs.get("mappings")
-                self.client.indices.create(
-                    index=index, settings=settings, mappings=mappings
-                )
+                self._known_indices.update(unknown)
+                return
+            for index in unknown:
+                if not self.client.indices.exists(index=index, expand_wildcards=expand):
+                    settings = dict(kwargs.get("settings") or {})
+                    index_settings = dict(settings.get("index", {}))
+                    index_settings.setdefault("refresh_interval", self.refresh_interval)
+                    settings["index"] = index_settings
+                    mappings = kwargs.get("mappings")
+                    self.client.indices.create(
+                        index=index, settings=settings, mappings=mappings
+                    )
+                self._known_indices.add(index)
         except Exception as err:
             raise ClientError(f"Error ensuring index: {str(err)}", errors=err) from err
 
+    def invalidate_index_cache(self, index: t.Optional[str] = None) -> None:
+        """Forgets that an index is known to exist.
+
+        Args:
+            index: Index name, or None to forget all indices.
+
+        Examples:
+            >>> from unittest.mock import Mock
+            >>> client = Mock(spec=Elasticsearch)
+            >>> client.indices = Mock()
+            >>> client.indices.exists.return_value = True
+            >>> backend = ElasticsearchBackend(client)
+            >>> backend.ensure_index("test_idx")
+            >>> backend.ensure_index("test_idx")
+            >>> client.indices.exists.call_count
+            1
+            >>> backend.invalidate_index_cache("test_idx")
+            >>> backend.ensure_index("test_idx")
+            >>> client.indices.exists.call_count
+            2
+        """
+        if index is None:
+            self._known_indices.clear()
+        else:
+            self._known_indices.discard(index)
+
 
 class FileBackend(StorageBackend):
     """Local file storage backend.
 
-    Stores documents as JSON files with an index file for search efficiency.
+    Stores documents as JSON files with an index file for search efficiency,
+    and an inverted index of the index file for term queries.
+    JSON is handled by orjson when it is installed, and by the standard library
+    json module otherwise.
+
+    The index file of each index is loaded once and kept in memory. Saves update
+    the in-memory copy, which is written back to disk after index_flush_size
+    saves, on flush, and when the backend is garbage collected or the
+    interpreter exits.
+
+    With write_behind, save queues document files to be written by a background
+    thread and returns at once. Queued documents are served from memory by get
+    and search, and flush waits for them to be written. Callers must not modify
+    a document after saving it.
 
     Args:
         base_path: Directory path for storing documents.
+        index_flush_size: Number of saves to an index after which its index file
+            is written (default: 256).
+        write_behind: Write document files on a background thread
+            (default: False).
+        queue_size: Maximum number of queued document writes before save
+            blocks, with write_behind (default: 1024).
+        read_workers: Number of threads reading document files for a search
+            (default: 8).
+        parallel_read_min: Number of document files a search reads one at a
+            time before it uses read_workers threads (default: 64).
 
     Examples:
         >>> import tempfile
@@ -286,9 +1156,150 @@ class FileBackend(StorageBackend):
         True
     """
 
-    def __init__(self, base_path: str):
+    def __init__(
+        self,
+        base_path: str,
+        index_flush_size: int = 256,
+        write_behind: bool = False,
+        queue_size: int = 1024,
+        read_workers: int = 8,
+        parallel_read_min: int = 64,
+    ):
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        #: int: Saves to an index after which its index file is written
+        self.index_flush_size = index_flush_size
+        #: int: Number of threads reading document files for a search
+        self.read_workers = read_workers
+        #: int: Number of document files a search reads without threads
+        self.parallel_read_min = parallel_read_min
+        #: set: Index directories known to exist, so ensure_index can skip them
+        self._known_indices: t.Set[str] = set()
+        #: dict: In-memory index file contents, keyed by index name
+        self._index_cache: t.Dict[str, t.Dict[str, t.Dict]] = {}
+        #: dict: Saves not yet written to each index file, keyed by index name
+        self._dirty: t.Dict[str, int] = {}
+        #: dict: Inverted indices of the index files, built on first search
+        self._term_indices: t.Dict[str, _TermIndex] = {}
+        weakref.finalize(
+            self, self._write_indices, self.base_path, self._index_cache, self._dirty
+        )
+        #: _WriteBehind: Background document writer, if write_behind is set
+        self._writer: t.Optional[_WriteBehind] = None
+        if write_behind:
+            self._writer = _WriteBehind(queue_size)
+            # Finalizers run newest first, so queued documents are written
+            # before the index files that point at them
+            weakref.finalize(self, self._writer.join)
+
+    @staticmethod
+    def _write_indices(
+        base_path: Path,
+        index_cache: t.Dict[str, t.Dict[str, t.Dict]],
+        dirty: t.Dict[str, int],
+        index: t.Optional[str] = None,
+    ) -> None:
+        """Writes dirty index files, replacing each one atomically.
+
+        A static method, so that the finalizer does not keep the backend alive.
+
+        Args:
+            base_path: Directory path of the backend.
+            index_cache: In-memory index file contents.
+            dirty: Unwritten save counts per index.
+            index: Index whose file to write, or None for all dirty indices.
+        """
+        names = list(dirty) if index is None else [index] if index in dirty else []
+        for name in names:
+            index_file = base_path / name / "_index.json"
+            tmp_file = index_file.with_name("_index.json.tmp")
+            tmp_file.write_bytes(_json_dumps(index_cache[name]))
+            os.replace(tmp_file, index_file)
+            del dirty[name]
+
+    def _get_index(self, index: str) -> t.Dict[str, t.Dict]:
+        """Returns the in-memory index file contents, loading them on first use.
+
+        Args:
+            index: Directory name.
+
+        Returns:
+            dict: Indexed metadata, keyed by document ID.
+        """
+        index_data = self._index_cache.get(index)
+        if index_data is None:
+            index_file = self.base_path / index / "_index.json"
+            index_data = {}
+            if index_file.exists():
+                index_data = _json_loads(index_file.read_bytes())
+            self._index_cache[index] = index_data
+        return index_data
+
+    def _get_terms(self, index: str) -> _TermIndex:
+        """Returns the inverted index of an index file, building it on first use.
+
+        Args:
+            index: Directory name.
+
+        Returns:
+            _TermIndex: Inverted index of the indexed metadata.
+        """
+        terms = self._term_indices.get(index)
+        if terms is None:
+            terms = _TermIndex()
+            for doc_id, metadata in self._get_index(index).items():
+                terms.add(doc_id, metadata)
+            self._term_indices[index] = terms
+        return terms
+
+    def _read_doc(self, file_path: Path) -> t.Dict:
+        """Reads a document file, or its queued copy with write_behind.
+
+        Args:
+            file_path: Path of the document file.
+
+        Returns:
+            dict: Document data.
+        """
+        if self._writer is not None:
+            doc = self._writer.get(file_path)
+            if doc is not None:
+                return doc
+        return _json_loads(file_path.read_bytes())
+
+    def flush(self, index: t.Optional[str] = None) -> None:
+        """Writes queued documents and in-memory index files to disk.
+
+        Queued documents are all written, whatever the index. With an index,
+        only that index file is written.
+
+        Args:
+            index: Directory name, or None to write all indices with unwritten
+                saves.
+
+        Raises:
+            ClientError: If an index file cannot be written.
+
+        Examples:
+            >>> import tempfile
+            >>> backend = FileBackend(tempfile.mkdtemp())
+            >>> backend.ensure_index("test_idx")
+            >>> doc_id = backend.save("test_idx", "doc1", {"field": "value"})
+            >>> index_file = backend.base_path / "test_idx" / "_index.json"
+            >>> json.loads(index_file.read_bytes())
+            {}
+            >>> backend.flush()
+            >>> json.loads(index_file.read_bytes())
+            {'doc1': {'field': 'value'}}
+        """
+        if self._writer is not None:
+            self._writer.join()
+        try:
+            self._write_indices(self.base_path, self._index_cache, self._dirty, index)
+        except Exception as err:
+            raise ClientError(
+                f"Error writing index file: {str(err)}", errors=err
+            ) from err
 
     def save(self, index: str, doc_id: t.Optional[str], doc: t.Dict, **kwargs) -> str:
         """Saves or updates a document as a JSON file.
@@ -325,21 +1336,26 @@ class FileBackend(StorageBackend):
         index_path = self.base_path / index
         try:
             if not doc_id:
-                doc_id = str(uuid.uuid4())
+                doc_id = new_doc_id()
             file_path = index_path / f"{doc_id}.json"
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(doc, f)
-            # Update index file
-            index_file = index_path / "_index.json"
-            index_data = {}
-            if index_file.exists():
-                with open(index_file, encoding="utf-8") as f:
-                    index_data = json.load(f)
-            index_data[doc_id] = {
-                k: v for k, v in doc.items() if isinstance(v, (str, int, bool))
-            }
-            with open(index_file, "w", encoding="utf-8") as f:
-                json.dump(index_data, f)
+            if self._writer is not None:
+                self._writer.put(file_path, doc)
+            else:
+                file_path.write_bytes(_json_dumps(doc))
+            # Update the in-memory index file, writing it out every so often
+            index_data = self._get_index(index)
+            metadata = _scalar_fields(doc)
+            terms = self._term_indices.get(index)
+            if terms is not None:
+                if doc_id in index_data:
+                    terms.remove(doc_id, index_data[doc_id])
+                terms.add(doc_id, metadata)
+            index_data[doc_id] = metadata
+            self._dirty[index] = self._dirty.get(index, 0) + 1
+            if self._dirty[index] >= self.index_flush_size:
+                self._write_indices(
+                    self.base_path, self._index_cache, self._dirty, index
+                )
             return doc_id
         except Exception as err:
             raise ClientError(f"Error saving document: {str(err)}", errors=err) from err
@@ -368,30 +1384,44 @@ class FileBackend(StorageBackend):
             'value'
         """
         index_path = self.base_path / index
-        if not index_path.exists():
+        if index not in self._known_indices and not index_path.exists():
             raise MissingIndex(f"Index {index} does not exist", index=index)
         file_path = index_path / f"{doc_id}.json"
+        if self._writer is not None:
+            doc = self._writer.get(file_path)
+            if doc is not None:
+                return doc
         if not file_path.exists():
             raise MissingDocument(
                 f"Document {doc_id} not found in {index}", index=index
             )
         try:
-            with open(file_path, encoding="utf-8") as f:
-                return json.load(f)
+            return _json_loads(file_path.read_bytes())
         except Exception as err:
             raise ClientError(
                 f"Error retrieving document: {str(err)}", errors=err
             ) from err
 
     def search(
-        self, index: str, query: t.Dict, size: int = 0, **kwargs
+        self,
+        index: str,
+        query: t.Dict,
+        size: int = 0,
+        with_ids: bool = False,
+        **kwargs,
     ) -> t.List[t.Dict]:
         """Searches documents using an index file.
 
+        Documents are matched against the in-memory index file, and only the
+        files of the first size matches are read. When there are more than
+        parallel_read_min of them, they are read by a pool of threads.
+
         Args:
             index: Directory name.
-            query: Query dictionary (supports term matching).
+            query: Query dictionary (supports term, exists, and bool matching).
             size: Maximum number of results (0 for all).
+            with_ids: Return each match as {"_id": doc_id, "_source": doc}
+                instead of the bare document (default: False).
             **kwargs: Ignored (for compatibility).
 
         Returns:
@@ -412,26 +1442,30 @@ class FileBackend(StorageBackend):
             'value'
         """
         index_path = self.base_path / index
-        if not index_path.exists():
+        if index not in self._known_indices and not index_path.exists():
             raise MissingIndex(f"Index {index} does not exist", index=index)
-        index_file = index_path / "_index.json"
-        if not index_file.exists():
-            return []
         try:
-            with open(index_file, encoding="utf-8") as f:
-                index_data = json.load(f)
-            results = []
-            for doc_id, metadata in index_data.items():
-                matches = True
-                if "term" in query:
-                    for key, value in query["term"].items():
-                        if metadata.get(key) != value:
-                            matches = False
-                            break
-                if matches:
-                    with open(index_path / f"{doc_id}.json", encoding="utf-8") as f:
-                        results.append(json.load(f))
-            return results[:size] if size > 0 else results
+            index_data = self._get_index(index)
+            doc_ids = self._get_terms(index).candidates(query)
+            if doc_ids is None:
+                doc_ids = list(index_data)
+            matches = _compile_query(query)
+            matched = [doc_id for doc_id in doc_ids if matches(index_data[doc_id])]
+            if size > 0:
+                matched = matched[:size]
+            paths = [index_path / f"{doc_id}.json" for doc_id in matched]
+            if len(paths) <= self.parallel_read_min:
+                docs = [self._read_doc(path) for path in paths]
+            else:
+                # File reads release the GIL, so reads overlap while docs are parsed
+                with ThreadPoolExecutor(max_workers=self.read_workers) as executor:
+                    docs = list(executor.map(self._read_doc, paths))
+            if with_ids:
+                return [
+                    {"_id": doc_id, "_source": doc}
+                    for doc_id, doc in zip(matched, docs)
+                ]
+            return docs
         except Exception as err:
             raise ClientError(
                 f"Error searching documents: {str(err)}", errors=err
@@ -440,6 +1474,9 @@ class FileBackend(StorageBackend):
     def ensure_index(self, index: str, **kwargs) -> None:
         """Ensures an index directory exists, creating it if necessary.
 
+        Indices found or created are remembered, and not checked again until
+        invalidate_index_cache is called.
+
         Args:
             index: Directory name.
             **kwargs: Ignored (for compatibility).
@@ -451,22 +1488,55 @@ class FileBackend(StorageBackend):
             >>> backend.base_path.joinpath("test_idx").exists()
             True
         """
+        if index in self._known_indices:
+            return
         try:
             index_path = self.base_path / index
             index_path.mkdir(parents=True, exist_ok=True)
             # Initialize index file
             index_file = index_path / "_index.json"
             if not index_file.exists():
-                with open(index_file, "w", encoding="utf-8") as f:
-                    json.dump({}, f)
+                index_file.write_bytes(_json_dumps({}))
         except Exception as err:
             raise ClientError(f"Error ensuring index: {str(err)}", errors=err) from err
+        self._known_indices.add(index)
+
+    def invalidate_index_cache(self, index: t.Optional[str] = None) -> None:
+        """Forgets that an index directory is known to exist.
+
+        Its in-memory index file and inverted index are discarded as well,
+        without being written.
+
+        Args:
+            index: Directory name, or None to forget all indices.
+
+        Examples:
+            >>> import shutil, tempfile
+            >>> backend = FileBackend(tempfile.mkdtemp())
+            >>> backend.ensure_index("test_idx")
+            >>> shutil.rmtree(backend.base_path / "test_idx")
+            >>> backend.invalidate_index_cache()
+            >>> backend.ensure_index("test_idx")
+            >>> (backend.base_path / "test_idx" / "_index.json").exists()
+            True
+        """
+        if index is None:
+            self._known_indices.clear()
+            self._index_cache.clear()
+            self._dirty.clear()
+            self._term_indices.clear()
+        else:
+            self._known_indices.discard(index)
+            self._index_cache.pop(index, None)
+            self._dirty.pop(index, None)
+            self._term_indices.pop(index, None)
 
 
 class InMemoryBackend(StorageBackend):
     """In-memory storage backend for testing or ephemeral use.
 
-    Stores documents in a nested dictionary.
+    Stores documents in a nested dictionary, with an inverted index of their
+    scalar fields for term queries.
 
     Examples:
         >>> backend = InMemoryBackend()
@@ -478,6 +1548,8 @@ class InMemoryBackend(StorageBackend):
 
     def __init__(self):
         self.store: t.Dict[str, t.Dict[str, t.Dict]] = {}
+        #: dict: Inverted index of each index's documents, keyed by index name
+        self._term_indices: t.Dict[str, _TermIndex] = {}
 
     def save(self, index: str, doc_id: t.Optional[str], doc: t.Dict, **kwargs) -> str:
         """Saves or updates a document in memory.
@@ -507,8 +1579,13 @@ class InMemoryBackend(StorageBackend):
             raise MissingIndex(f"Index {index} does not exist", index=index)
         try:
             if not doc_id:
-                doc_id = str(uuid.uuid4())
-            self.store[index][doc_id] = doc
+                doc_id = new_doc_id()
+            docs = self.store[index]
+            terms = self._term_indices[index]
+            if doc_id in docs:
+                terms.remove(doc_id, docs[doc_id])
+            terms.add(doc_id, doc)
+            docs[doc_id] = doc
             return doc_id
         except Exception as err:
             raise ClientError(f"Error saving document: {str(err)}", errors=err) from err
@@ -544,14 +1621,21 @@ class InMemoryBackend(StorageBackend):
         return self.store[index][doc_id]
 
     def search(
-        self, index: str, query: t.Dict, size: int = 0, **kwargs
+        self,
+        index: str,
+        query: t.Dict,
+        size: int = 0,
+        with_ids: bool = False,
+        **kwargs,
     ) -> t.List[t.Dict]:
         """Searches documents in memory.
 
         Args:
             index: Index name.
-            query: Query dictionary (supports term matching).
+            query: Query dictionary (supports term, exists, and bool matching).
             size: Maximum number of results (0 for all).
+            with_ids: Return each match as {"_id": doc_id, "_source": doc}
+                instead of the bare document (default: False).
             **kwargs: Ignored (for compatibility).
 
         Returns:
@@ -572,17 +1656,17 @@ class InMemoryBackend(StorageBackend):
         """
         if index not in self.store:
             raise MissingIndex(f"Index {index} does not exist", index=index)
-        results = []
-        for _, doc in self.store[index].items():
-            matches = True
-            if "term" in query:
-                for key, value in query["term"].items():
-                    if doc.get(key) != value:
-                        matches = False
-                        break
-            if matches:
-                results.append(doc)
-        return results[:size] if size > 0 else results
+        docs = self.store[index]
+        doc_ids = self._term_indices[index].candidates(query)
+        if doc_ids is None:
+            doc_ids = list(docs)
+        matches = _compile_query(query)
+        matched = [doc_id for doc_id in doc_ids if matches(docs[doc_id])]
+        if size > 0:
+            matched = matched[:size]
+        if with_ids:
+            return [{"_id": doc_id, "_source": docs[doc_id]} for doc_id in matched]
+        return [docs[doc_id] for doc_id in matched]
 
     def ensure_index(self, index: str, **kwargs) -> None:
         """Ensures an index exists in memory, creating it if necessary.
@@ -599,3 +1683,139 @@ class InMemoryBackend(StorageBackend):
         """
         if index not in self.store:
             self.store[index] = {}
+            self._term_indices[index] = _TermIndex()
+
+
+class CachingBackend(StorageBackend):
+    """Wraps a storage backend with a time-limited LRU cache of reads.
+
+    Results of get and search are cached for ttl seconds, keyed by index, doc
+    ID or canonical query, and size. Writes through this wrapper (save,
+    bulk_save, ensure_index) evict the cached results for that index, and for
+    any index pattern or list. Writes made by other processes or clients are
+    only seen once the cached result expires. Each lookup returns one deep copy
+    of the cached result, made on the way out, so callers may modify it. Other
+    attributes are looked up on the wrapped backend.
+
+    Args:
+        backend: Storage backend to wrap.
+        maxsize: Maximum number of cached results (default: 256).
+        ttl: Seconds a cached result stays valid (default: 60.0).
+
+    Examples:
+        >>> inner = InMemoryBackend()
+        >>> backend = CachingBackend(inner)
+        >>> backend.ensure_index("test_idx")
+        >>> doc_id = backend.save("test_idx", None, {"field": "value"})
+        >>> backend.search("test_idx", {"term": {"field": "value"}})
+        [{'field': 'value'}]
+        >>> inner.store["test_idx"].clear()  # Not seen until evicted
+        >>> backend.search("test_idx", {"term": {"field": "value"}})
+        [{'field': 'value'}]
+        >>> _ = backend.save("test_idx", doc_id, {"field": "other"})
+        >>> backend.search("test_idx", {"term": {"field": "value"}})
+        []
+    """
+
+    def __init__(self, backend: StorageBackend, maxsize: int = 256, ttl: float = 60.0):
+        #: StorageBackend: Wrapped backend
+        self.backend = backend
+        #: int: Maximum number of cached results
+        self.maxsize = maxsize
+        #: float: Seconds a cached result stays valid
+        self.ttl = ttl
+        #: OrderedDict: (expiry, result) by cache key, least recently used first
+        self._cache: "OrderedDict[t.Tuple, t.Tuple[float, t.Any]]" = OrderedDict()
+
+    def __getattr__(self, name: str) -> t.Any:
+        if name == "backend":  # Not set yet, e.g. while unpickling
+            raise AttributeError(name)
+        return getattr(self.backend, name)
+
+    def _lookup(self, key: t.Tuple, fetch: t.Callable[[], t.Any]) -> t.Any:
+        """Returns a copy of a cached result, calling fetch on a miss.
+
+        The cached result is copied once on the way out, on hits and misses
+        alike, so callers never hold a reference to the cached object.
+        """
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > now:
+            self._cache.move_to_end(key)
+            return copy.deepcopy(entry[1])
+        result = fetch()
+        self._cache[key] = (now + self.ttl, result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return copy.deepcopy(result)
+
+    def evict(self, index: t.Optional[str] = None) -> None:
+        """Drops cached results for an index, and for index patterns and lists.
+
+        Args:
+            index: Index name, or None to drop every cached result.
+        """
+        if index is None:
+            self._cache.clear()
+            return
+        for key in [
+            key
+            for key in self._cache
+            if key[1] == index or "*" in key[1] or "," in key[1]
+        ]:
+            del self._cache[key]
+
+    def save(self, index: str, doc_id: t.Optional[str], doc: t.Dict, **kwargs) -> str:
+        """Saves a document with the wrapped backend and evicts the index."""
+        self.evict(index)
+        return self.backend.save(index, doc_id, doc, **kwargs)
+
+    def bulk_save(self, docs: t.List[t.Tuple[str, str, t.Dict]]) -> None:
+        """Saves documents with the wrapped backend and evicts their indices."""
+        for index in {index for index, _, _ in docs}:
+            self.evict(index)
+        self.backend.bulk_save(docs)
+
+    def refresh(self, index: str) -> None:
+        """Refreshes the index with the wrapped backend."""
+        self.backend.refresh(index)
+
+    def invalidate_index_cache(self, index: t.Optional[str] = None) -> None:
+        """Evicts cached results and forgets the index in the wrapped backend."""
+        self.evict(index)
+        self.backend.invalidate_index_cache(index)
+
+    def get(self, index: str, doc_id: str) -> t.Dict:
+        """Retrieves a document, from the cache when possible."""
+        return self._lookup(
+            ("get", index, doc_id), lambda: self.backend.get(index, doc_id)
+        )
+
+    def search(
+        self,
+        index: str,
+        query: t.Dict,
+        size: int = 0,
+        with_ids: bool = False,
+        **kwargs,
+    ) -> t.List[t.Dict]:
+        """Searches documents, from the cache when possible."""
+        key = (
+            "search",
+            index,
+            json.dumps([query, kwargs], sort_keys=True, default=str),
+            size,
+            with_ids,
+        )
+        return self._lookup(
+            key,
+            lambda: self.backend.search(
+                index, query, size, with_ids=with_ids, **kwargs
+            ),
+        )
+
+    def ensure_index(self, index: str, **kwargs) -> None:
+        """Ensures the index exists with the wrapped backend and evicts it."""
+        self.evict(index)
+        self.backend.ensure_index(index, **kwargs)
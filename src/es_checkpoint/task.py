@@ -5,6 +5,7 @@ Provides the Task class for tracking Elasticsearch operations within a Job.
 
 # pylint: disable=C0115,R0902,R0913,R0917,W0107
 import typing as t
+from copy import deepcopy
 from dotmap import DotMap  # type: ignore
 from .debug import debug, begin_end
 from ._parent import TaskOrStep
@@ -13,7 +14,70 @@ if t.TYPE_CHECKING:
     from .job import Job
 
 
+class _AttrDict(dict):
+    """A dict whose keys can also be read and set as attributes.
+
+    Keeps attribute-style access to Task.data without DotMap, which wraps nested
+    dicts on access and has to be unwrapped with toDict before serializing.
+    Nested dicts are not converted, and missing attributes are not created. A
+    DotMap stored as a value is converted with toDict, because JSON encoders read
+    a DotMap, whose keys are not in its dict storage, as an empty object.
+
+    Examples:
+        >>> data = _AttrDict({"key": "value"})
+        >>> data.key
+        'value'
+        >>> data.other = 1
+        >>> data
+        {'key': 'value', 'other': 1}
+        >>> del data.other
+        >>> data.other
+        Traceback (most recent call last):
+        ...
+        AttributeError: other
+        >>> data.nested = DotMap({"key": "value"})
+        >>> type(data.nested).__name__
+        'dict'
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key: t.Any, value: t.Any) -> None:
+        if isinstance(value, DotMap):
+            value = value.toDict()
+        super().__setitem__(key, value)
+
+    def update(self, *args, **kwargs) -> None:  # pylint: disable=W0221
+        """Updates the dict, converting DotMap values like item assignment."""
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __getattr__(self, name: str) -> t.Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        self[name] = value
+
+    def __delattr__(self, name: str) -> None:
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
 class Task(TaskOrStep):
+    __slots__ = ("_data", "final_name", "is_ilm", "result")
+
+    # data is a dict that callers mutate in place, so never reuse a cached doc
+    CACHE_DOC = False
+
     def __init__(self, job: "Job", index: str, id_suffix: str = "", task_id: str = ""):
         """Initializes a Task object for tracking.
 
@@ -29,7 +93,9 @@ class Task(TaskOrStep):
         Examples:
             >>> from unittest.mock import Mock
             >>> backend = Mock()
-            >>> job = Mock(backend=backend, tracking_index="es-checkpoint", name="job1")
+            >>> backend.search.return_value = []
+            >>> job = Mock(backend=backend, tracking_index="es-checkpoint")
+            >>> job.name = "job1"
             >>> task = Task(job, "test_idx", id_suffix="suffix")
             >>> task.task_id
             'test_idx---suffix'
@@ -45,15 +111,11 @@ class Task(TaskOrStep):
         debug.lv2("Initializing Task object")
         if not id_suffix and not task_id:
             raise ValueError("Either id_suffix or task_id must be provided")
-        #: str: Task ID
-        self.task_id: str = ""
-        if task_id:
-            self.task_id = task_id
-        else:
-            self.task_id = f"{index}---{id_suffix}"
         super().__init__(job, index)
-        #: DotMap: Task data and results
-        self.data: DotMap = DotMap()
+        #: str: Task ID
+        self.task_id = task_id or f"{index}---{id_suffix}"
+        #: dict: Task data and results
+        self.data: t.Dict = _AttrDict()
         #: bool: Flag for ILM policy
         self.is_ilm: bool = False
         #: str: Final index name
@@ -65,6 +127,38 @@ class Task(TaskOrStep):
         self.result: t.Optional[t.Any] = None
         debug.lv3("Task object initialized")
 
+    @property
+    def data(self) -> t.Dict:
+        """dict: Task data and results.
+
+        Keys can also be read and set as attributes. A DotMap or dict assigned
+        here is converted once, so building the tracking document does not have
+        to unwrap it on every save.
+
+        Examples:
+            >>> from unittest.mock import Mock
+            >>> backend = Mock()
+            >>> backend.search.return_value = []
+            >>> job = Mock(backend=backend, tracking_index="es-checkpoint")
+            >>> job.name = "job1"
+            >>> task = Task(job, "test_idx", task_id="task1")
+            >>> task.data = DotMap({"key": {"nested": 1}})
+            >>> task.data
+            {'key': {'nested': 1}}
+            >>> type(task.data.key).__name__
+            'dict'
+            >>> task.data.other = "value"
+            >>> task.data["other"]
+            'value'
+        """
+        return self._data
+
+    @data.setter
+    def data(self, value: t.Union[t.Dict, DotMap]) -> None:
+        if isinstance(value, DotMap):
+            value = value.toDict()
+        self._data = value if isinstance(value, _AttrDict) else _AttrDict(value)
+
     @begin_end()
     def extra_fields(self) -> t.Dict:
         """Provides additional fields for the Task tracking document.
@@ -78,9 +172,11 @@ class Task(TaskOrStep):
         Examples:
             >>> from unittest.mock import Mock
             >>> backend = Mock()
-            >>> job = Mock(backend=backend, tracking_index="es-checkpoint", name="job1")
+            >>> backend.search.return_value = []
+            >>> job = Mock(backend=backend, tracking_index="es-checkpoint")
+            >>> job.name = "job1"
             >>> task = Task(job, "test_idx", task_id="task1")
-            >>> task.data = DotMap({"key": "value"})
+            >>> task.data = {"key": "value"}
             >>> task.is_ilm = True
             >>> fields = task.extra_fields()
             >>> fields["job"]
@@ -89,14 +185,19 @@ class Task(TaskOrStep):
             'task1'
             >>> fields["data"]
             {'key': 'value'}
+            >>> fields["data"] is task.data
+            False
             >>> fields["is_ilm"]
             True
         """
-        debug.lv3(f"Building Task extra fields for {self.task_id}")
+        if debug.level >= 3:
+            debug.lv3(f"Building Task extra fields for {self.task_id}")
         fields = super().extra_fields()
         fields.update(
             {
-                "data": self.data.toDict(),
+                # A snapshot, so later changes to data are not shared with
+                # the last saved doc or with docs waiting to be written
+                "data": deepcopy(dict(self.data)),
                 "is_ilm": self.is_ilm,
                 "final_name": self.final_name,
                 "result": self.result,
@@ -109,22 +210,23 @@ class Task(TaskOrStep):
         """Logs task attributes for debugging.
 
         Examples:
-            >>> from unittest.mock import Mock
+            >>> from unittest.mock import Mock, patch
             >>> backend = Mock()
-            >>> job = Mock(backend=backend, tracking_index="es-checkpoint", name="job1")
+            >>> backend.search.return_value = []
+            >>> job = Mock(backend=backend, tracking_index="es-checkpoint")
+            >>> job.name = "job1"
             >>> task = Task(job, "test_idx", task_id="task1")
-            >>> task.data = DotMap({"key": "value"})
-            >>> task.add_log = Mock()
-            >>> task.dump()
-            >>> task.add_log.called
+            >>> task.data = {"key": "value"}
+            >>> with patch.object(Task, "add_log") as add_log:
+            ...     task.dump()
+            >>> add_log.called
             True
         """
-        debug.lv3(f"Dumping attributes of {self.task_id} to log")
+        if debug.level >= 3:
+            debug.lv3(f"Dumping attributes of {self.task_id} to log")
         for attr in ["index", "task_id", "stub", "data"]:
-            if attr == "data":
-                value = self.data.toDict()
-            else:
-                value = getattr(self, attr, None)
+            value = getattr(self, attr, None)
             msg = f"{attr}: {value}"
             self.add_log(msg)
-            debug.lv5(f"--- {msg}")
+            if debug.level >= 5:
+                debug.lv5(f"--- {msg}")
@@ -1,18 +1,76 @@
 """Decorators for es-checkpoint exception handling.
 
 This module provides the try_except decorator for managing exceptions in the
-es-checkpoint module, used with handlers from tools.handlers.
+es-checkpoint module, used with handlers from tools.handlers, and the RetryPolicy
+it uses to retry failed calls.
 """
 
 # pylint: disable=R0913,R0917,W0718
 import typing as t
 import logging
+import random
+import time
+from dataclasses import dataclass
 from .utils import bind_args, has_arg, map_args
 from ..debug import debug
+from ..exceptions import _SLOTS
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, **_SLOTS)
+class RetryPolicy:
+    """Exponential backoff settings for retrying a call in try_except.
+
+    Attributes:
+        max_attempts (int): Total number of calls, including the first.
+        base (float): Cooldown in seconds before the first retry.
+        cap (float): Maximum cooldown in seconds, before jitter.
+        jitter (bool): Whether to add up to ``base`` random seconds per cooldown.
+        retry_if (t.Optional[t.Callable]): Predicate deciding whether a caught
+            exception is retried. None retries every caught exception.
+
+    Examples:
+        >>> policy = RetryPolicy(base=0.5, cap=3, jitter=False)
+        >>> [policy.cooldown(attempt) for attempt in range(5)]
+        [0.5, 1.0, 2.0, 3, 3]
+    """
+
+    max_attempts: int = 5
+    base: float = 0.5
+    cap: float = 30.0
+    jitter: bool = True
+    retry_if: t.Optional[t.Callable[[Exception], bool]] = None
+
+    def cooldown(self, attempt: int) -> float:
+        """Returns the seconds to wait after a failed attempt.
+
+        Args:
+            attempt: Zero-based number of the failed attempt.
+
+        Returns:
+            float: Cooldown in seconds.
+        """
+        delay = min(self.cap, self.base * 2**attempt)
+        if self.jitter:
+            delay += random.uniform(0, self.base)
+        return delay
+
+    def should_retry(self, exc: Exception, attempt: int) -> bool:
+        """Checks whether a failed attempt should be retried.
+
+        Args:
+            exc: Exception raised by the attempt.
+            attempt: Zero-based number of the failed attempt.
+
+        Returns:
+            bool: True if another attempt should be made.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return False
+        return self.retry_if is None or self.retry_if(exc)
+
+
 def try_except(
     exceptions: t.Optional[t.Any] = Exception,
     handler: t.Optional[t.Callable] = None,
@@ -21,6 +79,7 @@ def try_except(
     use: t.Optional[t.Type[Exception]] = None,
     use_map: t.Optional[t.Dict] = None,
     msg: t.Optional[str] = None,
+    retry: t.Optional[RetryPolicy] = None,
 ) -> t.Callable:
     """Wraps a function with a try/except block for exception handling.
 
@@ -35,17 +94,19 @@ def try_except(
         use: Custom exception class to raise (default: None).
         use_map: Dict mapping function args to exception attributes (default: None).
         msg: Custom message for logging and exception (default: None).
+        retry: Policy for retrying the call, with exponential backoff, before the
+            exception is handled (default: None, no retries).
 
     Returns:
         t.Callable: Decorated function with try/except logic.
 
     Examples:
-        >>> @try_except(exceptions=ValueError, default="Failed")
+        >>> @try_except(exceptions=ZeroDivisionError, default="Failed")
         ... def divide(a: int, b: int) -> float:
         ...     return a / b
         >>> divide(10, 0)
         'Failed'
-        >>> @try_except(exceptions=ValueError, msg="Division error")
+        >>> @try_except(ZeroDivisionError, use=ValueError, msg="Division error")
         ... def divide_log(a: int, b: int) -> float:
         ...     return a / b
         >>> try:
@@ -53,35 +114,78 @@ def try_except(
         ... except ValueError as e:
         ...     print(str(e).startswith("Division error"))
         True
+        >>> calls = []
+        >>> @try_except(exceptions=OSError, retry=RetryPolicy(base=0, jitter=False))
+        ... def flaky():
+        ...     calls.append(1)
+        ...     if len(calls) < 3:
+        ...         raise OSError("busy")
+        ...     return "ok"
+        >>> flaky(), len(calls)
+        ('ok', 3)
     """
 
+    # Arguments are only bound when an exception is handled, and only when the
+    # handler or the custom exception needs them
+    need_bind = handler is not None or use is not None
+    has_errors_arg = use is not None and has_arg(use.__init__, "errors")
+
     def decorator(func):
+        def handle(exc: Exception, args: t.Tuple, kwargs: t.Dict) -> t.Any:
+            # Called from the except block of a wrapper, so a bare raise re-raises
+            name = type(exc).__name__
+            message = f"{name} exception in {func.__name__}: {exc}"
+            if msg:
+                message = f"{msg}. {message}"
+            fn_args = bind_args(func, *args, **kwargs) if need_bind else {}
+            if handler:
+                handler(exc, fn_args)
+            else:
+                logger.error(message)
+            if use:
+                use_args, use_kwargs = map_args(fn_args, use_map)
+                if has_errors_arg:
+                    if "errors" in use_kwargs:
+                        use_kwargs["errors"] += (exc,)
+                    else:
+                        use_kwargs["errors"] = exc
+                raise use(message, *use_args, **use_kwargs) from exc
+            if re_raise:
+                raise  # pylint: disable=E0704
+            return default
+
         def wrapper(*args, **kwargs):
-            fn_args = bind_args(func, *args, **kwargs)
-            use_args, use_kwargs = map_args(fn_args, use_map)
-            try:
+            if debug.level >= 4:
                 debug.lv4(f"TRY: Calling {func.__name__}")
+            if debug.level >= 5:
                 debug.lv5(f"With args: {args}, kwargs: {kwargs}")
+            try:
                 return func(*args, **kwargs)
             except exceptions as exc:
-                message = f"{exc.__name__} exception in {func.__name__}: {exc}"
-                if msg:
-                    message = f"{msg}. {message}"
-                if handler:
-                    handler(exc, fn_args)
-                else:
-                    logger.error(message)
-                if use:
-                    if has_arg(use.__init__, "errors"):
-                        if "errors" in use_kwargs:
-                            use_kwargs["errors"] += (exc,)
-                        else:
-                            use_kwargs["errors"] = exc
-                    raise use(message, *use_args, **use_kwargs) from exc
-                if re_raise:
-                    raise
-                return default
-
-        return wrapper
+                return handle(exc, args, kwargs)
+
+        def retry_wrapper(*args, **kwargs):
+            attempt = 0
+            while True:
+                if debug.level >= 4:
+                    debug.lv4(f"TRY: Calling {func.__name__}")
+                if debug.level >= 5:
+                    debug.lv5(f"With args: {args}, kwargs: {kwargs}")
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as exc:
+                    if not retry.should_retry(exc, attempt):
+                        return handle(exc, args, kwargs)
+                    cooldown = retry.cooldown(attempt)
+                    attempt += 1
+                    logger.warning(
+                        f"Retrying {func.__name__} in {cooldown:.2f}s after "
+                        f"attempt {attempt} failed: {exc}",
+                        extra={"attempt": attempt, "cooldown": cooldown},
+                    )
+                    time.sleep(cooldown)
+
+        # Pick the wrapper once, so calls without a retry policy skip the loop
+        return wrapper if retry is None else retry_wrapper
 
     return decorator
@@ -8,13 +8,15 @@ import typing as t
 import logging
 from elasticsearch8.exceptions import (
     ApiError,
-    BadRequestError,
+    ConnectionError as EsConnectionError,
+    ConnectionTimeout,
     NotFoundError,
     TransportError,
 )
 from ..debug import debug, begin_end
 from ..exceptions import (
     ClientError,
+    EsResponse,
     FatalError,
     MissingIndex,
     MissingDocument,
@@ -24,12 +26,42 @@ from .utils import ender, two_values
 
 logger = logging.getLogger(__name__)
 
+#: HTTP status codes from a busy or restarting cluster that are worth retrying
+TRANSIENT_STATUSES = frozenset((429, 502, 503, 504))
+
+# Exception classes each handler checks for. Elasticsearch raises subclasses of
+# these (ConflictError, AuthenticationException, ...), so they are matched with
+# isinstance. BadRequestError is an ApiError, and needs no entry of its own.
+_ES_ERRORS = (ApiError, TransportError)
+_MISSING_INDEX_ERRORS = (NotFoundError, MissingIndex)
+_CONNECTION_ERRORS = (EsConnectionError, ConnectionTimeout)
+
+_EXC_TMPL = "The exception type was %s, with error message: %s"
+_TRIGGER_TMPL = "The triggering exception type was %s, with error message: %s"
+
 if t.TYPE_CHECKING:
     from ..job import Job
     from ..task import Task
     from ..step import Step
 
 
+def _describe(exception: Exception, template: str = _EXC_TMPL) -> str:
+    """Formats the type and first argument of an exception into a message.
+
+    The message is built once, then logged and passed to the exception raised.
+
+    Examples:
+        >>> _describe(ValueError("bad value"))
+        'The exception type was ValueError, with error message: bad value'
+        >>> _describe(ValueError())
+        'The exception type was ValueError, with error message: '
+    """
+    return template % (
+        type(exception).__name__,
+        exception.args[0] if exception.args else "",
+    )
+
+
 @begin_end()
 def es_response(exception: Exception) -> None:
     """Handles Elasticsearch API exceptions, excluding NotFoundError.
@@ -53,20 +85,50 @@ def es_response(exception: Exception) -> None:
         >>> es_response(NotFoundError("Not found"))  # No exception raised
     """
     if isinstance(exception, NotFoundError):
-        debug.lv3("NotFoundError detected, skipping")
+        if debug.level >= 3:
+            debug.lv3("NotFoundError detected, skipping")
         return
-    msg = (
-        f"The exception type was {exception.__class__.__name__}, "
-        f"with error message: {exception.args[0]}"
-    )
-    if isinstance(exception, (ApiError, TransportError, BadRequestError)):
-        pass
-    else:
+    msg = _describe(exception)
+    if not isinstance(exception, _ES_ERRORS):
         logger.warning("Other exception detected")
-    debug.lv5(msg)
+    if debug.level >= 5:
+        debug.lv5(msg)
     raise ClientError(msg, errors=exception)
 
 
+@begin_end()
+def is_transient(exception: Exception) -> bool:
+    """Checks whether an exception is a transient Elasticsearch failure.
+
+    Connection errors, timeouts, and API errors with a status in
+    TRANSIENT_STATUSES are transient. EsResponse exceptions, such as ClientError,
+    are transient if any of their upstream errors are.
+
+    Args:
+        exception: Exception to check.
+
+    Returns:
+        bool: True if retrying the call may succeed.
+
+    Examples:
+        >>> from elastic_transport import ApiResponseMeta, HttpHeaders
+        >>> meta = ApiResponseMeta(503, "1.1", HttpHeaders(), 0.1, None)
+        >>> is_transient(ApiError("unavailable", meta, {}))
+        True
+        >>> is_transient(ClientError("wrapped", errors=ConnectionTimeout("slow")))
+        True
+        >>> is_transient(ClientError("bad", errors=ValueError("bad")))
+        False
+    """
+    if isinstance(exception, _CONNECTION_ERRORS):
+        return True
+    if isinstance(exception, ApiError):
+        return exception.meta.status in TRANSIENT_STATUSES
+    if isinstance(exception, EsResponse):
+        return any(is_transient(err) for err in exception.errors)
+    return False
+
+
 @begin_end()
 def missing_handler(exception: Exception, fn_args: t.Dict[str, t.Any]) -> None:
     """Handles NotFoundError and MissingIndex/MissingDocument exceptions.
@@ -97,22 +159,19 @@ def missing_handler(exception: Exception, fn_args: t.Dict[str, t.Any]) -> None:
         ...     print(e.index)
         test_idx
     """
-    errors = exception.errors if hasattr(exception, "errors") else ""
-    name = fn_args.get("name") or None
-    index = fn_args.get("index") or None
-    job_id = fn_args.get("job_id") or None
-    task_id = fn_args.get("task_id") or None
-    stepname = fn_args.get("stepname") or None
+    errors = getattr(exception, "errors", "")
+    name = fn_args.get("name")
+    index = fn_args.get("index")
+    job_id = fn_args.get("job_id")
+    task_id = fn_args.get("task_id")
+    stepname = fn_args.get("stepname")
     m_name = two_values("name", name, "index", index)
     m_id = two_values("job_id", job_id, "task_id", task_id)
     if not stepname:
         stepname = "Unknown"
-    msg = (
-        f"The exception type was {exception.__class__.__name__}, "
-        f"with error message: {exception.args[0]}"
-    )
+    msg = _describe(exception)
     logger.error(msg)
-    if isinstance(exception, (NotFoundError, MissingIndex)):
+    if isinstance(exception, _MISSING_INDEX_ERRORS):
         raise MissingIndex(msg, errors=errors, index=m_name)
     if isinstance(exception, MissingDocument):
         raise MissingDocument(msg, errors=errors, index=m_name, doc_id=m_id)
@@ -151,21 +210,13 @@ def tracker_handler(exception: Exception, fn_args: t.Dict[str, t.Any]) -> None:
         ...     print(str(e))
         No step, task, or job object found in fn_args, or were None values
     """
-    exname = exception.__class__.__name__
-    msg = (
-        f"The triggering exception type was {exname}, "
-        f"with error message: {exception.args[0]}"
-    )
+    msg = _describe(exception, _TRIGGER_TMPL)
     logger.critical(msg, stacklevel=2)
-    if "step" in fn_args and fn_args["step"] is not None:
-        tracker: t.Union["Job", "Task", "Step"] = fn_args["step"]
-        tracker_type = "step"
-    elif "task" in fn_args and fn_args["task"] is not None:
-        tracker = fn_args["task"]
-        tracker_type = "task"
-    elif "job" in fn_args and fn_args["job"] is not None:
-        tracker = fn_args["job"]
-        tracker_type = "job"
+    tracker: t.Union["Job", "Task", "Step"]
+    for tracker_type in ("step", "task", "job"):
+        tracker = fn_args.get(tracker_type)
+        if tracker is not None:
+            break
     else:
         _ = "No step, task, or job object found in fn_args, or were None values"
         logger.error(_)
@@ -173,8 +224,10 @@ def tracker_handler(exception: Exception, fn_args: t.Dict[str, t.Any]) -> None:
     tracker.success = False
 
     ender(tracker)
-    debug.lv3("Exiting function, raising exception")
-    debug.lv5(f"Exception: {exception}")
+    if debug.level >= 3:
+        debug.lv3("Exiting function, raising exception")
+    if debug.level >= 5:
+        debug.lv5(f"Exception: {exception}")
     if isinstance(exception, FatalError):
         raise exception
     raise TrackerError(msg, tracker, tracker_type)
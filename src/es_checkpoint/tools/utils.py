@@ -5,7 +5,8 @@ Provides helper functions for argument handling, logging, and tracker management
 
 import typing as t
 import inspect
-from functools import lru_cache
+import weakref
+from operator import itemgetter
 from ..debug import debug, begin_end
 from ..exceptions import TrackerError
 
@@ -15,6 +16,10 @@ if t.TYPE_CHECKING:
     from ..step import Step
 
 
+#: dict: Method each tracker class runs before it ends, by class name
+_FINALIZERS = {"Task": "dump", "Step": "save_to_task"}
+
+
 @begin_end()
 def ender(obj: t.Union["Job", "Task", "Step"], msg: t.Optional[str] = None) -> None:
     """Finalizes a tracker object, marking success or failure.
@@ -27,17 +32,26 @@ def ender(obj: t.Union["Job", "Task", "Step"], msg: t.Optional[str] = None) -> N
         msg: Optional custom log message (default: None).
 
     Raises:
-        TrackerError: If tracker type is unsupported or methods fail.
+        TrackerError: If the tracker lacks end or its type-specific method.
 
     Examples:
         >>> from unittest.mock import Mock
-        >>> tracker = Mock(success=True, end=lambda **kw: None, dump=lambda: None)
+        >>> tracker = Mock(success=True)
         >>> tracker.__class__.__name__ = "Task"
         >>> ender(tracker, "Custom message")
         >>> tracker.end.called
         True
         >>> tracker.dump.called
         True
+        >>> step = Mock(success=True, dry_run=False, stub="step1", doc_id=None,
+        ...             tracking_index="idx", start_time=None)
+        >>> step.__class__.__name__ = "Step"
+        >>> del step.save_to_task
+        >>> try:
+        ...     ender(step)
+        ... except TrackerError as e:
+        ...     print(e.tracker_type)
+        step
     """
     if not obj.success:
         err = True
@@ -47,25 +61,65 @@ def ender(obj: t.Union["Job", "Task", "Step"], msg: t.Optional[str] = None) -> N
         log = "DONE"
     if msg:
         log = msg
-    tracker_type = obj.__class__.__name__.lower()
+    finalizer = _FINALIZERS.get(type(obj).__name__)
+    # Checked up front, so an AttributeError raised inside end() is not
+    # mistaken for an unsupported tracker
+    if not hasattr(obj, "end") or (finalizer and not hasattr(obj, finalizer)):
+        tracker_type = type(obj).__name__.lower()
+        raise TrackerError(f"Invalid tracker type: {tracker_type}", obj, tracker_type)
+    if finalizer is not None:
+        getattr(obj, finalizer)()
+    obj.end(completed=obj.success, errors=err, logmsg=log)
+
+
+#: WeakKeyDictionary: Signatures by function
+_SIGS: "weakref.WeakKeyDictionary[t.Callable, inspect.Signature]" = (
+    weakref.WeakKeyDictionary()
+)
+#: WeakKeyDictionary: Parameter names by function, for has_arg
+_PARAMS: "weakref.WeakKeyDictionary[t.Callable, t.FrozenSet[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+#: WeakKeyDictionary: Parameter names of functions whose parameters are all
+#: positional-or-keyword, so arguments can be bound by position. None for other
+#: functions.
+_PARAM_NAMES: "weakref.WeakKeyDictionary[t.Callable, t.Optional[t.Tuple[str, ...]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _cached(
+    cache: weakref.WeakKeyDictionary, fn: t.Callable, build: t.Callable
+) -> t.Any:
+    """Returns build(fn), computed once per function and kept in cache.
+
+    Entries go away with their function. Callables that cannot be weakly
+    referenced, such as built-in slot wrappers, are not cached.
+
+    Args:
+        cache: Cache to look fn up in.
+        fn: Function the value is computed for.
+        build: Callable computing the value from fn.
+
+    Returns:
+        t.Any: Cached or newly computed value.
+    """
     try:
-        if tracker_type == "task":
-            obj.dump()
-        elif tracker_type == "step":
-            obj.save_to_task()
-        obj.end(completed=obj.success, errors=err, logmsg=log)
-    except AttributeError as e:
-        raise TrackerError(
-            f"Invalid tracker type: {tracker_type}", obj, tracker_type
-        ) from e
-
-
-@lru_cache(maxsize=128)
-@begin_end()
+        return cache[fn]
+    except (KeyError, TypeError):
+        pass
+    value = build(fn)
+    try:
+        cache[fn] = value
+    except TypeError:
+        pass
+    return value
+
+
 def get_sig(fn: t.Callable) -> inspect.Signature:
     """Gets the signature of a function.
 
-    Caches the result for performance, useful for checking parameters.
+    Caches the result per function, useful for checking parameters.
 
     Args:
         fn: Function to inspect.
@@ -78,19 +132,48 @@ def get_sig(fn: t.Callable) -> inspect.Signature:
         ...     pass
         >>> sig = get_sig(example)
         >>> str(sig)
-        '(a: int, b: str = "test") -> None'
+        "(a: int, b: str = 'test') -> None"
     """
-    sig = inspect.signature(fn)
-    debug.lv5(f"Return value = {sig!r}")
-    return sig
+    return _cached(_SIGS, fn, inspect.signature)
+
+
+def _param_names(fn: t.Callable) -> t.Optional[t.Tuple[str, ...]]:
+    """Returns the cached parameter names of a function for bind_args.
+
+    Args:
+        fn: Function to inspect.
+
+    Returns:
+        t.Optional[t.Tuple[str, ...]]: Parameter names, or None if the function
+        has *args, **kwargs, positional-only, or keyword-only parameters.
+
+    Examples:
+        >>> def example(a: int, b: str = "test") -> None:
+        ...     pass
+        >>> _param_names(example)
+        ('a', 'b')
+        >>> def variadic(a: int, *rest) -> None:
+        ...     pass
+        >>> _param_names(variadic) is None
+        True
+    """
+
+    def build(func: t.Callable) -> t.Optional[t.Tuple[str, ...]]:
+        params = get_sig(func).parameters.values()
+        if all(param.kind is param.POSITIONAL_OR_KEYWORD for param in params):
+            return tuple(param.name for param in params)
+        return None
+
+    return _cached(_PARAM_NAMES, fn, build)
 
 
-@lru_cache(maxsize=128)
-@begin_end()
 def bind_args(fn: t.Callable, *args, **kwargs) -> t.Dict[str, t.Any]:
     """Binds function arguments to parameter names.
 
-    Returns a dictionary mapping parameter names to values, excluding 'self'.
+    Returns a new dictionary mapping parameter names to values, excluding
+    'self'. Parameters left to their defaults are not included. Positional
+    arguments are paired with the cached parameter names of fn, and only
+    functions with other kinds of parameters are bound with Signature.bind.
 
     Args:
         fn: Function to bind arguments for.
@@ -105,21 +188,23 @@ def bind_args(fn: t.Callable, *args, **kwargs) -> t.Dict[str, t.Any]:
         ...     pass
         >>> bind_args(example, 1, b="test")
         {'a': 1, 'b': 'test'}
+        >>> bind_args(example, [1], b={"unhashable": True})
+        {'a': [1], 'b': {'unhashable': True}}
     """
-    sig = get_sig(fn)
-    fn_args = sig.bind(*args, **kwargs).arguments
-    if "self" in fn_args:
-        del fn_args["self"]
-    debug.lv5(f"Return value = {fn_args!r}")
+    names = _param_names(fn)
+    if names is None or len(args) > len(names):
+        fn_args = dict(get_sig(fn).bind(*args, **kwargs).arguments)
+    else:
+        fn_args = dict(zip(names, args))
+        fn_args.update(kwargs)
+    fn_args.pop("self", None)
     return fn_args
 
 
-@lru_cache(maxsize=128)
-@begin_end()
 def has_arg(fn: t.Callable, arg: str) -> bool:
     """Checks if a function has a specific parameter.
 
-    Caches the result for performance, useful for validating signatures.
+    Caches the parameter names per function, useful for validating signatures.
 
     Args:
         fn: Function to check.
@@ -135,14 +220,12 @@ def has_arg(fn: t.Callable, arg: str) -> bool:
         True
         >>> has_arg(example, "c")
         False
+        >>> has_arg(ValueError.__init__, "errors")
+        False
     """
-    sig = get_sig(fn)
-    result = arg in sig.parameters
-    debug.lv5(f"Return value = {result}")
-    return result
+    return arg in _cached(_PARAMS, fn, lambda f: frozenset(get_sig(f).parameters))
 
 
-@begin_end()
 def name_or_index(argmap: t.Dict, fn_args: t.Dict) -> t.Dict:
     """Swaps 'index' and 'name' in argmap based on function signature.
 
@@ -166,24 +249,27 @@ def name_or_index(argmap: t.Dict, fn_args: t.Dict) -> t.Dict:
         {'index': 'test_idx', 'name': 'test_name'}
     """
     if "index" in argmap and "index" not in fn_args and "name" in fn_args:
-        debug.lv5("Found index in argmap, not in fn_args, found name")
-        debug.lv5("Swapping name with index in argmap")
+        if debug.level >= 5:
+            debug.lv5("Found index in argmap, not in fn_args, found name")
+            debug.lv5("Swapping name with index in argmap")
         argmap["name"] = argmap["index"]
         del argmap["index"]
     elif "name" in argmap and "name" not in fn_args and "index" in fn_args:
-        debug.lv5("Found name in argmap, not in fn_args, found index")
-        debug.lv5("Swapping index with name in argmap")
+        if debug.level >= 5:
+            debug.lv5("Found name in argmap, not in fn_args, found index")
+            debug.lv5("Swapping index with name in argmap")
         argmap["index"] = argmap["name"]
         del argmap["name"]
-    debug.lv5(f"Return value = {argmap!r}")
+    if debug.level >= 5:
+        debug.lv5(f"Return value = {argmap!r}")
     return argmap
 
 
-@begin_end()
 def positional_args(argmap: t.Dict[str, t.Any], fn_args: t.Dict[str, t.Any]) -> t.Tuple:
     """Extracts ordered positional arguments from a function call.
 
-    Uses argmap to map argument names to values, prioritizing 'value' keys.
+    Uses argmap to map argument names to values, prioritizing 'value' keys, in
+    the order of their 'position' keys.
 
     Args:
         argmap: Dictionary mapping argument names to metadata.
@@ -193,24 +279,21 @@ def positional_args(argmap: t.Dict[str, t.Any], fn_args: t.Dict[str, t.Any]) ->
         t.Tuple: Ordered positional arguments.
 
     Examples:
-        >>> argmap = {"a": {"position": 1, "value": 10}, "b": {"position": 2}}
+        >>> argmap = {"b": {"position": 2}, "a": {"position": 1, "value": 10}}
         >>> fn_args = {"a": 1, "b": "test"}
         >>> positional_args(argmap, fn_args)
         (10, 'test')
     """
-    retval: t.Tuple = ()
-    if argmap:
-        ordered = dict(sorted(argmap.items(), key=lambda item: item[1]))
-        for key in ordered:
-            if ordered[key].get("value", None) is not None:
-                retval += (ordered[key]["value"],)
-            else:
-                retval += (fn_args[key],)
-    debug.lv5(f"Return value = {retval!r}")
+    ordered = sorted(argmap.items(), key=lambda item: item[1].get("position", 0))
+    retval = tuple(
+        value["value"] if value.get("value") is not None else fn_args[key]
+        for key, value in ordered
+    )
+    if debug.level >= 5:
+        debug.lv5(f"Return value = {retval!r}")
     return retval
 
 
-@begin_end()
 def keyword_args(argmap: t.Dict[str, t.Any], fn_args: t.Dict[str, t.Any]) -> t.Dict:
     """Extracts keyword arguments from a function call.
 
@@ -236,7 +319,8 @@ def keyword_args(argmap: t.Dict[str, t.Any], fn_args: t.Dict[str, t.Any]) -> t.D
                 retval[argmap[k]["attr"]] = v["value"]
             else:
                 retval[argmap[k]["attr"]] = fn_args[k]
-    debug.lv5(f"Return value = {retval!r}")
+    if debug.level >= 5:
+        debug.lv5(f"Return value = {retval!r}")
     return retval
 
 
@@ -247,7 +331,8 @@ def map_args(
     """Maps function arguments to positional and keyword arguments.
 
     Processes fn_args and argmap to separate positional and keyword arguments,
-    handling 'index'/'name' swaps.
+    handling 'index'/'name' swaps. Gives the same results as positional_args and
+    keyword_args, in a single pass over argmap. fn_args is not modified.
 
     Args:
         fn_args: Dictionary of function arguments.
@@ -257,40 +342,57 @@ def map_args(
         t.Tuple[t.Tuple, t.Dict]: Positional and keyword arguments.
 
     Examples:
-        >>> fn_args = {"index": "test_idx", "b": "test"}
+        >>> fn_args = {"index": "test_idx", "b": "test", "c": 3}
         >>> argmap = {"index": {"position": 1}, "b": {"attr": "y"}}
         >>> args, kwargs = map_args(fn_args, argmap)
         >>> args, kwargs
         (('test_idx',), {'y': 'test'})
+        >>> fn_args
+        {'index': 'test_idx', 'b': 'test', 'c': 3}
     """
-    args = ()
     kwargs: t.Dict[str, t.Any] = {}
     if not argmap:
-        debug.lv3("No argmap provided, returning args and kwargs")
-        return args, kwargs
+        if debug.level >= 3:
+            debug.lv3("No argmap provided, returning args and kwargs")
+        return (), kwargs
     argmap = name_or_index(argmap, fn_args)
-    intersection = list(set(fn_args.keys()).intersection(argmap.keys()))
-    for key in list(fn_args):
-        if key not in intersection:
-            del fn_args[key]
-    ordered = {}
-    unordered = {}
-    for key in argmap:
-        position = argmap[key].get("position", 0)
+    # One pass does the work of positional_args and keyword_args
+    positional = []
+    for key, meta in argmap.items():
+        value = meta["value"] if meta.get("value") is not None else fn_args[key]
+        position = meta.get("position", 0)
         if position > 0:
-            ordered[key] = argmap[key]
+            positional.append((position, value))
         else:
-            unordered[key] = argmap[key]
-    args = positional_args(ordered, fn_args)
-    kwargs = keyword_args(unordered, fn_args)
-    debug.lv5(f"Return value = {(args, kwargs)}")
+            kwargs[meta["attr"]] = value
+    positional.sort(key=itemgetter(0))
+    args = tuple(value for _, value in positional)
+    if debug.level >= 5:
+        debug.lv5(f"Return value = {(args, kwargs)}")
     return args, kwargs
 
 
 def two_values(name1: str, val1: t.Any, name2: str, val2: t.Any) -> str:
-    """Formats two values into a string."""
-    if not val1 and not val2:
-        return "Unknown"
+    """Formats two values into a string.
+
+    Args:
+        name1: Name of the first value.
+        val1: First value.
+        name2: Name of the second value.
+        val2: Second value.
+
+    Returns:
+        str: The value that is set, "Unknown" if neither is, or a warning naming
+        both if both are.
+
+    Examples:
+        >>> two_values("name", None, "index", "test_idx")
+        'test_idx'
+        >>> two_values("name", None, "index", None)
+        'Unknown'
+        >>> two_values("name", "a", "index", "b")
+        'Both name "a" and index "b" found: IRREGULAR'
+    """
     if val1 and val2:
         return f"Both {name1} \"{val1}\" and {name2} \"{val2}\" found: IRREGULAR"
-    return f"{val1 if val1 else ''}{val2 if val2 else ''}"
+    return str(val1 or val2 or "Unknown")
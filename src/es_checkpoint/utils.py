@@ -5,18 +5,74 @@ Provides utility functions for storage operations and progress tracking.
 
 import typing as t
 from datetime import datetime, timezone
+import hashlib
 import json
 import logging
 from .debug import debug, begin_end
 from .exceptions import FatalError, MissingDocument
 from .storage import StorageBackend
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj: t.Any) -> str:
+        """Serializes to a compact JSON string with orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+else:  # pragma: no cover
+    _loads = json.loads
+    _dumps = json.dumps
+
 if t.TYPE_CHECKING:
     from . import Job, Task
 
 
+#: dict: Functions converting each job config field, by read or write
+_FIELDMAP: t.Dict[str, t.Dict[str, t.Callable]] = {
+    "read": {
+        "pattern": _loads,
+        "query": _loads,
+        "fields": _loads,
+        "message": str,
+        "expected_docs": int,
+        "restore_settings": _loads,
+        "delete": str,
+    },
+    "write": {
+        "pattern": _dumps,
+        "query": _dumps,
+        "fields": _dumps,
+        "message": str,
+        "expected_docs": int,
+        "restore_settings": _dumps,
+        "delete": str,
+    },
+}
+
+#: tuple: Job config fields kept in the tracking document
+_CONFIG_FIELDS = (
+    "pattern",
+    "query",
+    "fields",
+    "message",
+    "restore_settings",
+    "delete",
+)
+
+#: dict: (field, converter) pairs for the job config fields, per behavior
+_CONFIG_DISPATCH: t.Dict[str, t.Tuple[t.Tuple[str, t.Callable], ...]] = {
+    behavior: tuple((field, fieldmap[field]) for field in _CONFIG_FIELDS)
+    for behavior, fieldmap in _FIELDMAP.items()
+}
+
+
 @begin_end()
 def do_search(
     backend: StorageBackend,
@@ -24,6 +80,8 @@ def do_search(
     query: t.Dict,
     size: int = 0,
     aggs: t.Optional[t.Dict] = None,
+    source_includes: t.Optional[t.Sequence[str]] = None,
+    with_ids: bool = False,
 ) -> t.List[t.Dict]:
     """Performs a search query against a storage backend.
 
@@ -33,6 +91,10 @@ def do_search(
         query: Search query in backend-specific format.
         size: Maximum number of results (default: 0).
         aggs: Optional aggregation query (default: None).
+        source_includes: Fields to return, for backends that can filter
+            document sources (default: None, all fields).
+        with_ids: Return each match as {"_id": doc_id, "_source": doc}
+            (default: False).
 
     Returns:
         list[dict]: List of matching documents.
@@ -47,10 +109,14 @@ def do_search(
         >>> results[0]["field"]
         'value'
     """
-    debug.lv5(f"Search query = {query}")
-    kwargs = {"aggs": aggs} if aggs else {}
-    response = backend.search(index_pattern, query, size, **kwargs)
-    debug.lv5(f"Return value = {response}")
+    if debug.level >= 5:
+        debug.lv5(f"Search query = {query}")
+    kwargs: t.Dict[str, t.Any] = {"aggs": aggs} if aggs else {}
+    if source_includes:
+        kwargs["source_includes"] = list(source_includes)
+    response = backend.search(index_pattern, query, size, with_ids=with_ids, **kwargs)
+    if debug.level >= 5:
+        debug.lv5(f"Return value = {response}")
     return response
 
 
@@ -78,33 +144,13 @@ def config_fieldmap(
 
     Examples:
         >>> config_fieldmap("read", "query")  # doctest: +ELLIPSIS
-        <function loads at ...>
+        <...function loads...>
         >>> config_fieldmap("write", "message")
         <class 'str'>
     """
-    debug.lv5("Getting config fieldmap")
-    which = {
-        "read": {
-            "pattern": json.loads,
-            "query": json.loads,
-            "fields": json.loads,
-            "message": str,
-            "expected_docs": int,
-            "restore_settings": json.loads,
-            "delete": str,
-        },
-        "write": {
-            "pattern": json.dumps,
-            "query": json.dumps,
-            "fields": json.dumps,
-            "message": str,
-            "expected_docs": int,
-            "restore_settings": json.dumps,
-            "delete": str,
-        },
-    }
-    debug.lv5(f"Return value = {which}")
-    return which[rw_val][key]
+    if debug.level >= 5:
+        debug.lv5("Getting config fieldmap")
+    return _FIELDMAP[rw_val][key]
 
 
 @begin_end()
@@ -130,9 +176,11 @@ def create_index(
         >>> backend.ensure_index.called
         True
     """
-    debug.lv3(f"Creating index: {name}")
+    if debug.level >= 3:
+        debug.lv3(f"Creating index: {name}")
     backend.ensure_index(name, mappings=mappings, settings=settings)
-    debug.lv5(f"Index {name} ensured")
+    if debug.level >= 5:
+        debug.lv5(f"Index {name} ensured")
 
 
 @begin_end()
@@ -161,37 +209,41 @@ def get_progress_doc(
         >>> from unittest.mock import Mock
         >>> backend = Mock()
         >>> backend.get.return_value = {"task": "task1"}
-        >>> job = Mock(backend=backend, tracking_index="idx", name="job1")
+        >>> job = Mock(backend=backend, tracking_index="idx")
+        >>> job.name = "job1"
         >>> get_progress_doc(job=job, task_id="task1")
         {'task': 'task1'}
     """
     debug.lv2("Starting function...")
-    if (job is None and task is None) or (job is not None and task is not None):
+    if (job is None) == (task is None):
         msg = "Must provide either a job or a task"
         logger.critical(msg)
         debug.lv3("Exiting function, raising exception")
         debug.lv5("Exception: ValueError")
         raise FatalError(msg, errors=ValueError(msg))
-    if job:
-        debug.lv3(f"Getting progress doc for task: {task}")
+    if task is None:
+        if debug.level >= 3:
+            debug.lv3(f"Getting progress doc for task: {task_id}")
         stepname = ""
         if not task_id:
             msg = "No value provided for task_id"
             logger.critical(msg)
             raise ValueError(msg)
-    if task:
-        debug.lv3(f"Getting progress doc for step: {stepname}")
-        job = task.job
-        task_id = task.task_id
+    else:
+        if debug.level >= 3:
+            debug.lv3(f"Getting progress doc for step: {stepname}")
         if not stepname:
             msg = "No value provided for stepname"
             logger.critical(msg)
             raise ValueError(msg)
+        job = task.job
+        task_id = task.task_id
     backend = job.backend
     tracking_idx = job.tracking_index
     job_id = job.name
     retval = progress_doc_req(backend, tracking_idx, job_id, task_id, stepname=stepname)
-    debug.lv5(f"Return value = {retval}")
+    if debug.level >= 5:
+        debug.lv5(f"Return value = {retval}")
     return retval
 
 
@@ -218,16 +270,19 @@ def get_tracking_doc(backend: StorageBackend, name: str, job_id: str) -> t.Dict:
         >>> get_tracking_doc(backend, "es-checkpoint", "job1")
         {'job': 'job1'}
     """
-    debug.lv3(f"Getting tracking doc for {job_id}...")
+    if debug.level >= 3:
+        debug.lv3(f"Getting tracking doc for {job_id}...")
     try:
         doc = backend.get(name, job_id)
-        debug.lv5(f"backend.get response: {doc}")
+        if debug.level >= 5:
+            debug.lv5(f"backend.get response: {doc}")
         return doc
     except MissingDocument as err:
         msg = f"Tracking document for {job_id} does not exist"
         logger.critical(msg)
         debug.lv3("Exiting function, raising exception")
-        debug.lv5(f"Exception: {msg}")
+        if debug.level >= 5:
+            debug.lv5(f"Exception: {msg}")
         raise MissingDocument(msg, index=name) from err
 
 
@@ -239,19 +294,73 @@ def now_iso8601() -> str:
         str: Current timestamp in ISO8601 format with Zulu notation.
 
     Examples:
-        >>> from datetime import datetime
-        >>> datetime.now = lambda tz=None: datetime(2023, 1, 1, tzinfo=timezone.utc)
-        >>> now_iso8601()
-        '2023-01-01T00:00:00Z'
+        >>> import re
+        >>> pattern = r"\\d{4}-\\d\\d-\\d\\dT\\d\\d:\\d\\d:\\d\\d(\\.\\d{6})?Z"
+        >>> re.fullmatch(pattern, now_iso8601()) is not None
+        True
+    """
+    # A UTC isoformat() always ends in "+00:00"
+    return f"{datetime.now(timezone.utc).isoformat()[:-6]}Z"
+
+
+def progress_doc_id(job_id: str, task_id: str, stepname: str = "") -> str:
+    """Returns the document ID of a task or step tracking document.
+
+    The ID is derived from the job, task and step names, so a tracker can get
+    its document by ID instead of searching for it. It has the 32 hex digit
+    format of :func:`~es_checkpoint.storage.new_doc_id`.
+
+    Args:
+        job_id: Job name for the tracking run.
+        task_id: Task ID for the tracking document.
+        stepname: Step name (default: "").
+
+    Returns:
+        str: Document ID.
+
+    Examples:
+        >>> doc_id = progress_doc_id("job1", "task1")
+        >>> len(doc_id)
+        32
+        >>> doc_id == progress_doc_id("job1", "task1", "")
+        True
+        >>> doc_id == progress_doc_id("job1", "task1", "s1")
+        False
+    """
+    key = "\0".join((job_id, task_id, stepname)).encode("utf-8")
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+
+def _progress_stub(job_id: str, task_id: str, stepname: str) -> str:
+    """Returns the description of a task or step used in progress messages."""
+    stub = f"Task: {task_id} of Job: {job_id}"
+    return f"Step: {stepname} of {stub}" if stepname else stub
+
+
+def _progress_query(job_id: str, task_id: str, stepname: str) -> t.Dict:
+    """Builds the query matching the tracking document of a task or step.
+
+    Examples:
+        >>> query = _progress_query("job1", "task1", "")
+        >>> query["bool"]["must_not"]
+        {'exists': {'field': 'step'}}
+        >>> _progress_query("job1", "task1", "s1")["bool"]["filter"][-1]
+        {'term': {'step': 's1'}}
     """
-    parts = datetime.now(timezone.utc).isoformat().split("+")
-    if len(parts) == 1:
-        if parts[0][-1] == "Z":
-            return parts[0]
-        return f"{parts[0]}Z"
-    if parts[1] == "00:00":
-        return f"{parts[0]}Z"
-    return f"{parts[0]}+{parts[1]}"
+    query: t.Dict = {
+        "bool": {
+            "must": {"parent_id": {"type": "task", "id": job_id}},
+            "filter": [
+                {"term": {"task": task_id}},
+                {"term": {"job": job_id}},
+            ],
+        }
+    }
+    if stepname:
+        query["bool"]["filter"].append({"term": {"step": stepname}})
+    else:
+        query["bool"]["must_not"] = {"exists": {"field": "step"}}
+    return query
 
 
 @begin_end()
@@ -261,18 +370,27 @@ def progress_doc_req(
     job_id: str,
     task_id: str,
     stepname: str = "",
+    source_includes: t.Optional[t.Sequence[str]] = None,
+    doc_id: t.Optional[str] = None,
 ) -> t.Dict:
     """Retrieves a task or step tracking document.
 
+    With a doc_id, usually from :func:`progress_doc_id`, the document is first
+    fetched by ID and returned as ``{"_id": doc_id, "_source": doc}``. Only
+    when there is no document with that ID, as for documents written with
+    random IDs, is the tracking index searched.
+
     Args:
         backend: Storage backend for document operations.
         name: Tracking index name.
         job_id: Job name for the tracking run.
         task_id: Task ID for the tracking document.
         stepname: Step name (default: "").
+        source_includes: Fields of the document to return (default: None, all).
+        doc_id: Document ID to try before searching (default: None).
 
     Returns:
-        dict: Progress tracking document.
+        dict: Progress tracking document as {"_id": doc_id, "_source": doc}.
 
     Raises:
         MissingIndex: If the tracking index does not exist.
@@ -285,43 +403,160 @@ def progress_doc_req(
         >>> backend.search.return_value = [{"_source": {"task": "task1"}}]
         >>> progress_doc_req(backend, "es-checkpoint", "job1", "task1")
         {'_source': {'task': 'task1'}}
+        >>> backend.get.return_value = {"task": "task1"}
+        >>> progress_doc_req(backend, "es-checkpoint", "job1", "task1", doc_id="d1")
+        {'_id': 'd1', '_source': {'task': 'task1'}}
     """
-    debug.lv3(f"Getting progress doc for {name}...")
-    stub = f"Task: {task_id} of Job: {job_id}"
-    query = {
-        "bool": {
-            "must": {"parent_id": {"type": "task", "id": job_id}},
-            "filter": [],
-        }
-    }
-    filters = [
-        {"term": {"task": task_id}},
-        {"term": {"job": job_id}},
-    ]
-    if not stepname:
-        debug.lv2(f"Tracking progress for {stub}")
-        query["bool"]["must_not"] = {"exists": {"field": "step"}}
-    else:
-        stub = f"Step: {stepname} of Task: {task_id} of Job: {job_id}"
+    if debug.level >= 3:
+        debug.lv3(f"Getting progress doc for {name}...")
+    if doc_id:
+        try:
+            return {"_id": doc_id, "_source": backend.get(name, doc_id)}
+        except MissingDocument:
+            debug.lv5("No document with that ID, searching")
+    stub = _progress_stub(job_id, task_id, stepname)
+    if debug.level >= 2:
         debug.lv2(f"Tracking progress for {stub}")
-        filters.append({"term": {"step": stepname}})
-    query["bool"]["filter"] = filters
-    debug.lv4(f"Getting progress doc for {name} with query: {query}")
-    result = do_search(backend, name, query)
-    debug.lv5(f"do_search result: {result}")
+    query = _progress_query(job_id, task_id, stepname)
+    if debug.level >= 4:
+        debug.lv4(f"Getting progress doc for {name} with query: {query}")
+    result = do_search(
+        backend, name, query, source_includes=source_includes, with_ids=True
+    )
+    if debug.level >= 5:
+        debug.lv5(f"do_search result: {result}")
     if len(result) > 1:
         msg = f"Tracking document for {stub} is not unique. This should never happen."
         logger.critical(msg)
         debug.lv3("Exiting function, raising exception")
-        debug.lv5(f"Exception: {msg}")
+        if debug.level >= 5:
+            debug.lv5(f"Exception: {msg}")
         raise FatalError(msg)
     if not result:
         msg = f"Tracking document for {stub} does not exist"
         debug.lv3("Exiting function, raising exception")
-        debug.lv5(f"Exception: {msg}")
+        if debug.level >= 5:
+            debug.lv5(f"Exception: {msg}")
         raise MissingDocument(msg, index=name)
     retval = result[0]
-    debug.lv5(f"Return value = {retval}")
+    if debug.level >= 5:
+        debug.lv5(f"Return value = {retval}")
+    return retval
+
+
+@begin_end()
+def progress_docs_bulk(
+    backend: StorageBackend,
+    name: str,
+    job_id: str,
+    specs: t.Iterable[t.Tuple[str, str]],
+    source_includes: t.Optional[t.Sequence[str]] = None,
+) -> t.Dict[t.Tuple[str, str], t.Dict]:
+    """Retrieves several task or step tracking documents with one multi-search.
+
+    Each spec is a (task_id, stepname) tuple, with an empty stepname for a task.
+    Use :func:`progress_doc_req` when only one document is needed.
+
+    Args:
+        backend: Storage backend for document operations.
+        name: Tracking index name.
+        job_id: Job name for the tracking run.
+        specs: (task_id, stepname) tuples of the documents to fetch.
+        source_includes: Fields of the documents to return (default: None, all).
+
+    Returns:
+        dict: Progress tracking document for each spec as
+        {"_id": doc_id, "_source": doc}, keyed by spec. Specs without a tracking
+        document map to an empty dict.
+
+    Raises:
+        MissingIndex: If the tracking index does not exist.
+        FatalError: If multiple tracking documents are found for a spec.
+
+    Examples:
+        >>> from unittest.mock import Mock
+        >>> backend = Mock()
+        >>> backend.msearch.return_value = [[{"_id": "d1", "_source": {}}], []]
+        >>> specs = [("task1", ""), ("task1", "s1")]
+        >>> progress_docs_bulk(backend, "es-checkpoint", "job1", specs)
+        {('task1', ''): {'_id': 'd1', '_source': {}}, ('task1', 's1'): {}}
+        >>> backend.msearch.call_count
+        1
+    """
+    specs = list(dict.fromkeys(specs))
+    if not specs:
+        return {}
+    if debug.level >= 3:
+        debug.lv3(f"Getting {len(specs)} progress docs for {name}...")
+    queries = [_progress_query(job_id, *spec) for spec in specs]
+    results = backend.msearch(
+        name, queries, source_includes=source_includes, with_ids=True
+    )
+    retval = {}
+    for spec, result in zip(specs, results):
+        if len(result) > 1:
+            stub = _progress_stub(job_id, *spec)
+            msg = (
+                f"Tracking document for {stub} is not unique. This should never "
+                f"happen."
+            )
+            logger.critical(msg)
+            raise FatalError(msg)
+        retval[spec] = result[0] if result else {}
+    if debug.level >= 5:
+        debug.lv5(f"Return value = {retval}")
+    return retval
+
+
+@begin_end()
+def step_docs_req(
+    backend: StorageBackend, name: str, job_id: str, task_id: str
+) -> t.Dict[str, t.Dict]:
+    """Retrieves all step tracking documents for a task in a single search.
+
+    Args:
+        backend: Storage backend for document operations.
+        name: Tracking index name.
+        job_id: Job name for the tracking run.
+        task_id: Task ID the steps belong to.
+
+    Returns:
+        dict: Step tracking documents as {"_id": doc_id, "_source": doc},
+        keyed by step name.
+
+    Raises:
+        MissingIndex: If the tracking index does not exist.
+
+    Examples:
+        >>> from unittest.mock import Mock
+        >>> backend = Mock()
+        >>> backend.search.return_value = [
+        ...     {"_id": "d1", "_source": {"step": "s1"}},
+        ...     {"_id": "d2", "_source": {"step": "s2"}},
+        ... ]
+        >>> sorted(step_docs_req(backend, "es-checkpoint", "job1", "task1"))
+        ['s1', 's2']
+    """
+    if debug.level >= 3:
+        debug.lv3(f"Getting step docs for Task: {task_id} of Job: {job_id}")
+    query = {
+        "bool": {
+            "must": {"parent_id": {"type": "task", "id": job_id}},
+            "filter": [
+                {"term": {"task": task_id}},
+                {"term": {"job": job_id}},
+                {"exists": {"field": "step"}},
+            ],
+        }
+    }
+    result = do_search(backend, name, query, with_ids=True)
+    retval = {}
+    for hit in result:
+        stepname = hit["_source"].get("step")
+        if stepname:
+            retval[stepname] = hit
+    if debug.level >= 5:
+        debug.lv5(f"Return value = {retval}")
     return retval
 
 
@@ -343,20 +578,15 @@ def parse_job_config(config: t.Dict, behavior: t.Literal["read", "write"]) -> t.
         >>> parse_job_config(config, "read")
         {'query': {'match_all': {}}, 'message': 'test'}
     """
-    debug.lv3("Parsing job configuration")
-    debug.lv5(f"config = {config}, behavior = {behavior}")
-    fields = [
-        "pattern",
-        "query",
-        "fields",
-        "message",
-        "restore_settings",
-        "delete",
-    ]
-    doc = {}
-    for field in fields:
-        if field in config:
-            func = config_fieldmap(behavior, field)
-            doc[field] = func(config[field])
-    debug.lv5(f"Return value = {doc}")
+    if debug.level >= 3:
+        debug.lv3("Parsing job configuration")
+    if debug.level >= 5:
+        debug.lv5(f"config = {config}, behavior = {behavior}")
+    doc = {
+        field: convert(config[field])
+        for field, convert in _CONFIG_DISPATCH[behavior]
+        if field in config
+    }
+    if debug.level >= 5:
+        debug.lv5(f"Return value = {doc}")
     return doc